@@ -1,3 +1,7 @@
-﻿from src.Vebp.Builder.Builder import Builder
+﻿from src.Resources.Baker import AssetBaker
+from src.Vebp.Builder.Builder import Builder
+
+# 先烘焙贴图，Baked 文件夹会和 InternalResources 一起复制到构建结果中
+AssetBaker.from_config("bake.json").bake()
 
 Builder.from_package().build()
\ No newline at end of file
@@ -1,4 +1,13 @@
-﻿from src.Editor.Launch import run
+﻿import sys
 
 if __name__ == '__main__':
-    run()
\ No newline at end of file
+    if "--profile-startup" in sys.argv:
+        # 先安装导入计时，再导入编辑器
+        from src.Startup import Startup_
+        Startup_.install()
+
+        from src.Editor import App
+        Startup_.profile(App)
+    else:
+        from src.Editor.Launch import run
+        run()
\ No newline at end of file
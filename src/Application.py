@@ -1,43 +1,119 @@
-﻿import pygame
+﻿import time
 
-pygame.init()
+import pygame
 
 from src.InputSystem import InputSystem
 from src.Libs.Utils.tool import Tool
 from src.Libs.Window import WindowUtils
+from src.Resources.Font.Assets import FontAssets
+from src.Resources.Manager import ResourceManager_
+from src.Surface import SurfaceRender
+from src.Startup import Startup_
+from src.Surface.compositor import Compositor_
+from src.Tracer import Tracer_
 from src.Window.Manager import WindowManager
 
-WindowUtils.center()
 
 class Application:
-    def __init__(self, main: str) -> None:
-        self.window_manager = WindowManager()
-        self.window_init()
-        self.window_manager.switch(main)
-        self.window_manager.init()
+    def __init__(self, main: str, dirty_rect: bool = False, fixed_rate: int | None = None,
+                 render_rate: int = 60, max_steps: int = 5, coalesce_events: bool = False) -> None:
+        """
+        参数:
+            main (str): 启动时显示的窗口
+            dirty_rect (bool): 是否只刷新发生变化的区域
+            fixed_rate (int, optional): 每秒 fixed_update 的次数，为 None 时不启用固定步长
+            render_rate (int): 目标帧率，为 0 时不限制
+            max_steps (int): 每帧最多补跑的 fixed_update 次数，超出的时间直接丢弃
+            coalesce_events (bool): 是否合并同一帧内连续的鼠标移动事件和重复的窗口事件
+        """
+        with Startup_.phase("pygame.init"):
+            # 在创建第一个窗口之前才初始化，导入 Application 不再有副作用
+            WindowUtils.center()
+            pygame.init()
 
-        self.input_system = InputSystem()
+        self.dirty_rect = dirty_rect
+
+        self.fixed_rate = fixed_rate
+        self.render_rate = render_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+        with Startup_.phase("window_init"):
+            self.window_manager = WindowManager()
+            self.window_init()
+        with Startup_.phase("WindowManager.switch"):
+            self.window_manager.switch(main)
+            self.window_manager.init()
+
+        self.input_system = InputSystem(coalesce_events)
 
         self.surface_display = pygame.display.get_surface()
         self.clock = pygame.time.Clock()
+        self.last_time = time.perf_counter()
 
     def window_init(self) -> None: ...
 
     def handle_events(self) -> None:
-        for event in self.input_system.Get():
-            if event.quit:
-                Tool.exit()
-            self.window_manager.handle_event(event)
+        with Tracer_.span("InputSystem.Get"):
+            events = self.input_system.Get()
+        with Tracer_.span("WindowManager.handle_event"):
+            for event in events:
+                if event.quit:
+                    Tool.exit()
+                self.window_manager.handle_event(event)
+
+    def step(self, delta: float) -> None:
+        """
+        把这一帧经过的时间累加起来，按固定步长调用 fixed_update，并计算渲染用的插值系数
+        """
+        dt = 1 / self.fixed_rate
+        self.accumulator += delta
+
+        steps = 0
+        while self.accumulator >= dt and steps < self.max_steps:
+            self.window_manager.fixed_update(dt)
+            self.accumulator -= dt
+            steps += 1
+
+        if self.accumulator >= dt:
+            # 补跑次数达到上限仍然落后，丢弃整步的欠账，避免越卡越慢
+            self.accumulator %= dt
+
+        self.alpha = self.accumulator / dt
 
     def update(self) -> None:
-        self.clock.tick(60)
-        self.surface_display.fill("black")
-        self.window_manager.update()
-        self.window_manager.render()
-        pygame.display.update()
+        with Tracer_.span("clock.tick"):
+            self.clock.tick(self.render_rate)
+        now = time.perf_counter()
+        delta, self.last_time = now - self.last_time, now
+        if self.fixed_rate:
+            with Tracer_.span("fixed_update"):
+                self.step(delta)
+
+        with Tracer_.span("dirty.clear"):
+            if not self.dirty_rect:
+                self.window_manager.dirty.invalidate()
+            self.window_manager.dirty.clear(self.surface_display, "black")
+        with Tracer_.span("WindowManager.update"):
+            self.window_manager.update()
+        with Tracer_.span("WindowManager.render"):
+            rects = self.window_manager.render(self.alpha)
+        with Tracer_.span("display.update"):
+            if self.dirty_rect:
+                pygame.display.update(rects)
+            else:
+                pygame.display.update()
+
+        FontAssets.cache.end_frame()
+        SurfaceRender.cache.end_frame()
+        ResourceManager_.end_frame()
+        Compositor_.end_frame()
+        Tracer_.frame()
 
     def run(self) -> None:
         self.window_manager.enter()
+        self.last_time = time.perf_counter()
         while True:
             self.handle_events()
             self.update()
\ No newline at end of file
@@ -0,0 +1,105 @@
+﻿import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy
+import pygame
+
+from src.Blend import Blend
+from src.Resources.Baked import BakedAssets
+from src.Resources.Baker import AssetBaker
+from src.Surface.derived import DerivedCache
+
+
+def _make_textures(folder: Path, count: int, size: int) -> list[Path]:
+    """
+    生成 count 张 size x size 的 PNG，内容是平滑渐变加少量噪声，压缩率接近真实的 UI 贴图
+    """
+    paths = []
+    ramp = numpy.linspace(0, 255, size, dtype=numpy.float32)
+    for i in range(count):
+        rng = numpy.random.default_rng(i)
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[..., 0] = ramp[:, None]
+        rgb[..., 1] = ramp[None, :]
+        rgb[..., 2] = rng.integers(0, 32, (size, size), dtype=numpy.uint8)
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[...] = (ramp[:, None] + ramp[None, :]) / 2
+        del alpha
+
+        path = folder / "Texture" / f"{i}.png"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(surface, path)
+        paths.append(path)
+    return paths
+
+
+def _measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(count: int = 50, size: int = 128, repeat: int = 5) -> dict[str, float]:
+    """
+    对比从 PNG 解码并现场着色与从烘焙贴图包读取的耗时
+
+    返回:
+        dict: 加载全部贴图的平均耗时 (毫秒)
+    """
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        source = temp / "assets"
+        paths = _make_textures(source, count, size)
+        textures = {path.relative_to(source).as_posix(): {"blend": [["multiply", "red"]]} for path in paths}
+        pack = AssetBaker(source, temp / "assets.pack", textures).bake()
+
+        def png() -> None:
+            for path in paths:
+                pygame.image.load(path).convert_alpha()
+
+        def png_tint() -> None:
+            for path in paths:
+                Blend.multiply(pygame.image.load(path), "red").convert_alpha()
+
+        def baked() -> None:
+            assets = BakedAssets(pack, source)
+            for path in paths:
+                assets.texture(path).convert_alpha()
+
+        def baked_tint() -> None:
+            assets = BakedAssets(pack, source)
+            for path in paths:
+                key = DerivedCache.key("Blend.multiply", assets.source_key(assets.texture(path)), "red")
+                assets.derived(key).convert_alpha()
+
+        return {
+            "png": _measure(png, repeat),
+            "baked": _measure(baked, repeat),
+            "png + tint": _measure(png_tint, repeat),
+            "baked + tint": _measure(baked_tint, repeat),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SaxEngine baked asset benchmark")
+    parser.add_argument("--count", type=int, default=50, help="number of textures")
+    parser.add_argument("--size", type=int, default=128, help="texture width and height")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    for name, ms in run(args.count, args.size, args.repeat).items():
+        print(f"{name:<14} {ms:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
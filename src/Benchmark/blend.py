@@ -0,0 +1,93 @@
+﻿import os
+import time
+
+import pygame
+
+from src.Blend import Blend
+from src.Data.path import in_assets
+
+
+def _random_surface(size: tuple[int, int], seed: int) -> pygame.Surface:
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    state = seed
+    surface.lock()
+    for x in range(size[0]):
+        for y in range(size[1]):
+            state = (state * 1103515245 + 12345) & 0x7FFFFFFF
+            surface.set_at((x, y), (state & 255, (state >> 8) & 255, (state >> 16) & 255, (state >> 3) & 255))
+    surface.unlock()
+    return surface
+
+
+def _same(a: pygame.Surface, b: pygame.Surface) -> bool:
+    return a.get_size() == b.get_size() and pygame.image.tobytes(a, "RGBA") == pygame.image.tobytes(b, "RGBA")
+
+
+def parity() -> dict[str, bool]:
+    """
+    对比 Blend.multiply 与逐像素参考实现的输出是否逐字节一致
+    """
+    sources = {
+        "close.png": pygame.image.load(in_assets / "Texture" / "close.png"),
+        "max.png": pygame.image.load(in_assets / "Texture" / "max.png"),
+        "random": _random_surface((61, 47), 1),
+    }
+    colors = ["red", (10, 200, 30), (10, 200, 30, 128), (255, 255, 255, 0)]
+
+    results = {}
+    for name, surface in sources.items():
+        for color in colors:
+            results[f"{name} {color}"] = _same(Blend.multiply(surface, color), Blend.multiply_pixels(surface, color))
+    return results
+
+
+def _measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(size: int = 512, repeat: int = 20) -> dict[str, float]:
+    """
+    返回:
+        dict: 各混合模式处理一张 size x size 贴图的平均耗时 (毫秒)
+    """
+    surface = pygame.transform.smoothscale(pygame.image.load(in_assets / "Texture" / "close.png"), (size, size))
+
+    results = {"multiply_pixels": _measure(lambda: Blend.multiply_pixels(surface, "red"), 1)}
+    modes = {
+        "multiply": lambda: Blend.multiply(surface, "red"),
+        "multiply (alpha)": lambda: Blend.multiply(surface, (255, 0, 0, 128)),
+        "tint": lambda: Blend.tint(surface, "red"),
+        "alpha_multiply": lambda: Blend.alpha_multiply(surface, 128),
+        "add": lambda: Blend.add(surface, (40, 40, 40)),
+        "screen": lambda: Blend.screen(surface, "red"),
+        "overlay": lambda: Blend.overlay(surface, "red"),
+    }
+    for name, func in modes.items():
+        try:
+            results[name] = _measure(func, repeat)
+        except ImportError:
+            pass
+
+    return results
+
+
+def main() -> None:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.quit()
+    pygame.init()
+
+    failed = [name for name, ok in parity().items() if not ok]
+    print("parity: ok" if not failed else f"parity: FAILED {failed}")
+
+    for name, ms in run().items():
+        print(f"{name:<18} {ms:10.3f} ms")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
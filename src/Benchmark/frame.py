@@ -0,0 +1,318 @@
+﻿import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+from src.Application import Application
+from src.Data.Fonts import msyh_font
+from src.Libs.Window.display import Display
+from src.Window.Embedded import EmbeddedWindow
+from src.Window.Independence import IndependenceWindow
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# 对比时参与判断的指标，数值越大越差
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "alloc_peak_kb", "peak_rss_mb")
+
+
+class BenchWindow(IndependenceWindow):
+    def __init__(self, title: str = "bench", count: int = 0) -> None:
+        super().__init__(1280, 720, title)
+        for i in range(count):
+            self.add(f"window{i}", EmbeddedWindow(320, 180, f"Window {i}"))
+            self.open_children(f"window{i}", 200 + (i % 5) * 220, 140 + (i // 5) % 4 * 150)
+
+
+class TextWindow(BenchWindow):
+    def __init__(self, lines: int = 240) -> None:
+        super().__init__("text")
+        self.lines = lines
+        self.frame = 0
+
+    def render(self) -> None:
+        super().render()
+        self.frame += 1
+        font = msyh_font.render(18)
+        for i in range(self.lines):
+            # 一半是不变的标签，一半是每帧都会变化的数字
+            text = f"Label {i}" if i % 2 else f"Value {i}: {self.frame * (i + 1) % 100003}"
+            self.box.blit(font.render(text), ((i // 30) * 160, (i % 30) * 22))
+
+
+class BenchApp(Application):
+    def __init__(self, windows: dict[str, IndependenceWindow], main: str) -> None:
+        self.windows = windows
+        super().__init__(main, render_rate=0)
+
+    def window_init(self) -> None:
+        super().window_init()
+        for name, window in self.windows.items():
+            self.window_manager.add(name, window)
+
+
+Script = Callable[[BenchApp, int], None]
+
+
+def _nothing(app: BenchApp, frame: int) -> None: ...
+
+
+def scene_embedded(count: int) -> tuple[BenchApp, Script]:
+    return BenchApp({"main": BenchWindow("embedded", count)}, "main"), _nothing
+
+
+def scene_text(count: int) -> tuple[BenchApp, Script]:
+    return BenchApp({"main": TextWindow(count * 15)}, "main"), _nothing
+
+
+def scene_switch(count: int) -> tuple[BenchApp, Script]:
+    windows = {"a": BenchWindow("a", count), "b": BenchWindow("b", count)}
+
+    def script(app: BenchApp, frame: int) -> None:
+        if frame % 10 == 0:
+            app.window_manager.switch("b" if app.window_manager.current_window is windows["a"] else "a")
+
+    return BenchApp(windows, "a"), script
+
+
+def scene_drag(count: int) -> tuple[BenchApp, Script]:
+    window = BenchWindow("drag", count)
+    target = next(iter(window.embedded_windows.values()))
+    state = {"pos": None}
+
+    def script(app: BenchApp, frame: int) -> None:
+        # 用合成的鼠标事件拖动第一个子窗口绕圈移动，每 120 帧松开并重新按下标题栏
+        # 第 0 帧还没有渲染过，子窗口的位置还不可用
+        if frame == 0:
+            return
+        step = (frame - 1) % 120
+        if step == 0:
+            rect = Display.get_global_rect(target.title_bar_rect, target.get_center_box())
+            state["pos"] = rect.center
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=rect.center, button=1))
+            return
+        if step == 119:
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=state["pos"], button=1))
+            return
+
+        angle = step / 119 * math.tau
+        x, y = state["pos"]
+        pos = int(640 + 300 * math.cos(angle)), int(360 + 200 * math.sin(angle))
+        state["pos"] = pos
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(pos[0] - x, pos[1] - y), buttons=(1, 0, 0)))
+
+    return BenchApp({"main": window}, "main"), script
+
+
+SCENES: dict[str, Callable[[int], tuple[BenchApp, Script]]] = {
+    "embedded": scene_embedded,
+    "text": scene_text,
+    "switch": scene_switch,
+    "drag": scene_drag,
+}
+
+
+def peak_rss() -> float | None:
+    """
+    返回:
+        float | None: 当前进程的峰值常驻内存 (MB)，无法获取时为 None
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS 单位是字节，Linux 是 KB
+        return value / 1024 / 1024 if sys.platform == "darwin" else value / 1024
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")
+            ]
+
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi = ctypes.windll.psapi
+        psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(Counters), wintypes.DWORD]
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize / 1024 / 1024
+
+    return None
+
+
+def _frame(app: BenchApp, script: Script, frame: int) -> None:
+    script(app, frame)
+    app.handle_events()
+    app.update()
+
+
+def run_scene(name: str, frames: int = 600, count: int = 16, warmup: int = 60, alloc_frames: int = 120) -> dict[str, float | None]:
+    """
+    在当前进程中运行一个场景
+
+    帧时间与内存分配分两轮测量，避免 tracemalloc 拖慢计时；
+    alloc_peak_kb 是每帧临时分配的峰值中位数，blocks_per_frame 是每帧净增加的内存块数量，持续为正说明有泄漏
+
+    返回:
+        dict: 各项指标
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.quit()
+    pygame.init()
+
+    app, script = SCENES[name](count)
+    app.window_manager.enter()
+
+    for i in range(warmup):
+        _frame(app, script, i)
+
+    times = []
+    for i in range(warmup, warmup + frames):
+        start = time.perf_counter()
+        _frame(app, script, i)
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    peaks = []
+    for i in range(warmup + frames, warmup + frames + alloc_frames):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        _frame(app, script, i)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    blocks = (sys.getallocatedblocks() - blocks) / alloc_frames
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(times, n=100)
+    return {
+        "frames": frames,
+        "mean_ms": statistics.fmean(times),
+        "p50_ms": quantiles[49],
+        "p95_ms": quantiles[94],
+        "p99_ms": quantiles[98],
+        "max_ms": max(times),
+        "alloc_peak_kb": statistics.median(peaks) / 1024,
+        "blocks_per_frame": blocks,
+        "peak_rss_mb": peak_rss(),
+    }
+
+
+def run(scenes: list[str], frames: int = 600, count: int = 16) -> dict:
+    """
+    每个场景在独立的子进程中运行，保证峰值内存互不影响
+
+    返回:
+        dict: 可以直接保存为基准文件的结果
+    """
+    results = {}
+    for name in scenes:
+        process = subprocess.run(
+            [sys.executable, "-m", "src.Benchmark.frame", "--scene", name, "--frames", str(frames), "--count", str(count)],
+            cwd=ROOT, capture_output=True, text=True, env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"),
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"scene {name} failed:\n{process.stderr}")
+        results[name] = json.loads(process.stdout.strip().splitlines()[-1])
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": frames,
+            "count": count,
+        },
+        "scenes": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 10.0) -> list[str]:
+    """
+    逐项对比两份结果并打印变化百分比
+
+    参数:
+        threshold (float): 变差超过该百分比视为退化
+
+    返回:
+        list: 退化的 "场景.指标"
+    """
+    regressions = []
+    for name, result in current["scenes"].items():
+        old = baseline["scenes"].get(name)
+        if old is None:
+            print(f"{name:<10} (not in baseline)")
+            continue
+
+        for metric in METRICS:
+            before, after = old.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name}.{metric}")
+            print(f"{name:<10} {metric:<12} {before:10.3f} -> {after:10.3f}  {change:+7.1f}%{flag}")
+
+    return regressions
+
+
+def _print(result: dict) -> None:
+    for name, values in result["scenes"].items():
+        print(f"{name:<10} p50 {values['p50_ms']:7.3f} ms  p95 {values['p95_ms']:7.3f} ms  p99 {values['p99_ms']:7.3f} ms  "
+              f"alloc peak {values['alloc_peak_kb']:8.1f} KB  blocks {values['blocks_per_frame']:+7.1f}  "
+              f"rss {values['peak_rss_mb'] or 0:7.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SaxEngine headless frame benchmark")
+    parser.add_argument("--scenes", nargs="+", default=list(SCENES), choices=list(SCENES))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--count", type=int, default=16, help="number of embedded windows / text columns per scene")
+    parser.add_argument("--output", type=Path, help="save the result as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    parser.add_argument("--scene", choices=list(SCENES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scene:
+        print(json.dumps(run_scene(args.scene, args.frames, args.count)))
+        return
+
+    result = run(args.scenes, args.frames, args.count)
+    _print(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=4)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, result, args.threshold)
+        if regressions:
+            print(f"regressions: {', '.join(regressions)}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
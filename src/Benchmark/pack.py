@@ -0,0 +1,111 @@
+﻿import argparse
+import os
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import numpy
+import pygame
+
+from src.Libs.File.pack import PackReader, PackWriter
+from src.Libs.File.zip import ZipContent
+
+
+def _make_assets(folder: Path, count: int, size: int) -> list[str]:
+    """
+    生成 count 张 size x size 的噪声 PNG，噪声图几乎不能压缩，接近真实贴图的大小
+    """
+    names = []
+    for i in range(count):
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(surface)[:] = numpy.random.default_rng(i).integers(0, 256, (size, size, 3), dtype="uint8")
+        name = f"Texture/{i // 50}/{i}.png"
+        (folder / name).parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(surface, folder / name)
+        names.append(name)
+    return names
+
+
+def _measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(count: int = 200, size: int = 64, repeat: int = 5) -> dict[str, float]:
+    """
+    对比从 zip 解压和从打包文件读取贴图的耗时
+
+    返回:
+        dict: 各项的平均耗时 (毫秒)
+    """
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        assets = temp / "assets"
+        names = _make_assets(assets, count, size)
+        one = names[len(names) // 2]
+
+        zip_path = temp / "assets.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as z:
+            for name in names:
+                z.write(assets / name, name)
+        pack_path = PackWriter(temp / "assets.pack").add_folder(assets).close()
+
+        def zip_one() -> None:
+            with ZipContent(zip_path) as folder:
+                pygame.image.load(folder / one)
+
+        def zip_all() -> None:
+            with ZipContent(zip_path) as folder:
+                for name in names:
+                    pygame.image.load(folder / name)
+
+        def zipfile_one() -> None:
+            with zipfile.ZipFile(zip_path) as z:
+                pygame.image.load(z.open(one), one)
+
+        def pack_one() -> None:
+            with PackReader(pack_path) as pack:
+                pack.load_image(one)
+
+        def pack_all() -> None:
+            with PackReader(pack_path) as pack:
+                for name in names:
+                    pack.load_image(name)
+
+        def pack_verify() -> None:
+            with PackReader(pack_path) as pack:
+                pack.verify()
+
+        results = {
+            "zip extract, load one": _measure(zip_one, repeat),
+            "zipfile.open, load one": _measure(zipfile_one, repeat),
+            "pack, load one": _measure(pack_one, repeat),
+            "zip extract, load all": _measure(zip_all, repeat),
+            "pack, load all": _measure(pack_all, repeat),
+            "pack, verify all": _measure(pack_verify, repeat),
+        }
+        results["zip size (KB)"] = os.path.getsize(zip_path) / 1024
+        results["pack size (KB)"] = os.path.getsize(pack_path) / 1024
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SaxEngine packed asset benchmark")
+    parser.add_argument("--count", type=int, default=200, help="number of textures")
+    parser.add_argument("--size", type=int, default=64, help="texture width and height")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+
+    for name, value in run(args.count, args.size, args.repeat).items():
+        unit = "" if "size" in name else " ms"
+        print(f"{name:<24} {value:10.3f}{unit}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
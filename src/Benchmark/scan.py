@@ -0,0 +1,94 @@
+﻿import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.Libs.File import FolderStream
+from src.Libs.File.index import FolderIndex
+
+SUFFIXES = (".png", ".json", ".ogg", ".ttf")
+
+
+def _make_tree(root: Path, files: int, per_folder: int = 100, fanout: int = 10) -> int:
+    """
+    生成 files 个空文件，每个文件夹 per_folder 个，文件夹按 fanout 分层嵌套
+
+    返回:
+        int: 生成的文件夹数量
+    """
+    folders = (files + per_folder - 1) // per_folder
+    for f in range(folders):
+        parts = []
+        n = f
+        while True:
+            parts.append(f"d{n % fanout}")
+            n //= fanout
+            if not n:
+                break
+        folder = root.joinpath(*reversed(parts), f"leaf{f}")
+        folder.mkdir(parents=True, exist_ok=True)
+        for i in range(min(per_folder, files - f * per_folder)):
+            open(folder / f"asset{i}{SUFFIXES[i % len(SUFFIXES)]}", "wb").close()
+    return folders
+
+
+def _measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(files: int = 100_000, repeat: int = 3) -> dict[str, float]:
+    """
+    返回:
+        dict: 各项的平均耗时 (毫秒)
+    """
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        _make_tree(root, files)
+        folder = FolderStream(root)
+
+        def os_walk() -> None:
+            for _ in os.walk(root):
+                pass
+
+        def scan() -> None:
+            for _ in folder.scan():
+                pass
+
+        def linear_find() -> None:
+            # 没有索引时查找一个文件名需要遍历整棵树
+            for entry in folder.scan():
+                if entry.name == "asset99.ttf":
+                    pass
+
+        index = FolderIndex(str(root))
+        results = {
+            "os.walk": _measure(os_walk, repeat),
+            "FolderStream.scan": _measure(scan, repeat),
+            "index build": _measure(lambda: FolderIndex(str(root)), repeat),
+            "index build (parallel)": _measure(lambda: FolderIndex(str(root), parallel=True), repeat),
+            "index refresh": _measure(index.refresh, repeat),
+            "linear find": _measure(linear_find, repeat),
+        }
+
+        index.find("asset0.png")
+        results["index find"] = _measure(lambda: index.find("asset99.ttf"), 1000)
+        results["index suffix"] = _measure(lambda: index.suffix(".png"), 1000)
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SaxEngine directory scanning benchmark")
+    parser.add_argument("--files", type=int, default=100_000, help="number of files in the synthetic tree")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, ms in run(args.files, args.repeat).items():
+        print(f"{name:<24} {ms:12.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
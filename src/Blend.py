@@ -2,45 +2,119 @@
 from pygame import Surface
 
 from src.Libs.Utils.types import ColorType
+from src.Surface.derived import DerivedCache, DerivedCache_
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Blend:
     @staticmethod
-    def multiply(surface: Surface, color: ColorType):
+    def to_rgba(color: ColorType) -> tuple[int, int, int, int]:
         """
-        将 surface 的每个像素颜色与指定颜色相乘
+        将颜色统一转换为 RGBA 元组
 
         参数:
-            surface (pygame.Surface): 要处理的图像表面
             color (tuple or str): 混合颜色，支持格式:
                 - (R, G, B) 元组 (0-255)
                 - (R, G, B, A) 元组 (0-255)
                 - 颜色名称字符串 (如 "red")
-
-        返回:
-            pygame.Surface: 处理后的新表面（保留原始格式）
         """
-        # 将颜色统一转换为 RGBA 元组
-        def get_color(f, c):
-            if f // 255 == 0:
-                return c
-
-            return (f * c) // 255
-
-
         if isinstance(color, str):
             color_obj = pygame.Color(color)
-            blend_color = (color_obj.r, color_obj.g, color_obj.b, color_obj.a)
+            return color_obj.r, color_obj.g, color_obj.b, color_obj.a
         elif isinstance(color, tuple):
             if len(color) == 3:
-                blend_color = color + (255,)  # 添加不透明 alpha
+                return color + (255,)  # 添加不透明 alpha
             elif len(color) == 4:
-                blend_color = color
+                return color
             else:
                 raise ValueError("Color tuple must have 3 (RGB) or 4 (RGBA) elements")
         else:
             raise TypeError("Color must be tuple or string")
 
+    @staticmethod
+    def _arrays(surface: Surface):
+        """
+        返回可直接写回 surface 的 (rgb, alpha) 数组，没有逐像素透明通道时 alpha 为 None
+        """
+        rgb = pygame.surfarray.pixels3d(surface)
+        alpha = pygame.surfarray.pixels_alpha(surface) if surface.get_flags() & pygame.SRCALPHA else None
+        return rgb, alpha
+
+    @staticmethod
+    def _vectorized(surface: Surface) -> bool:
+        return numpy is not None and surface.get_bitsize() in (24, 32)
+
+    @staticmethod
+    def _require_numpy(mode: str) -> None:
+        if numpy is None:
+            raise ImportError(f"Blend.{mode} requires numpy")
+
+    @staticmethod
+    def cached(mode: str, surface: Surface, *args) -> Surface:
+        """
+        通过磁盘缓存调用混合模式，相同的源图与参数只计算一次
+
+        参数:
+            mode (str): 混合模式的方法名，如 "multiply"
+            surface (pygame.Surface): 要处理的图像表面
+            *args: 传给混合模式的其它参数
+
+        返回:
+            pygame.Surface: 处理后的新表面
+        """
+        func = getattr(Blend, mode)
+        key = DerivedCache.key("Blend." + mode, DerivedCache.surface_key(surface), *args)
+        return DerivedCache_.get(key, func, surface, *args)
+
+    @staticmethod
+    def multiply(surface: Surface, color: ColorType) -> Surface:
+        """
+        将 surface 的每个像素颜色与指定颜色相乘
+
+        与最初的逐像素实现保持一致: RGB 通道直接取混合颜色，alpha 通道按 a * A // 255 相乘
+
+        参数:
+            surface (pygame.Surface): 要处理的图像表面
+            color (tuple or str): 混合颜色
+
+        返回:
+            pygame.Surface: 处理后的新表面（保留原始格式）
+        """
+        r, g, b, a = Blend.to_rgba(color)
+        result = surface.copy()
+
+        if not Blend._vectorized(result):
+            if a != 255 or result.get_bitsize() not in (24, 32):
+                return Blend.multiply_pixels(surface, color)
+            # 乘以 (0, 0, 0, 255) 清空 RGB 并保持 alpha 不变，再加上混合颜色，此时结果与逐像素实现一致
+            result.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
+            result.fill((r, g, b, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            return result
+
+        rgb, alpha = Blend._arrays(result)
+        rgb[...] = (r, g, b)
+        if alpha is not None:
+            alpha[...] = alpha.astype(numpy.uint16) * a // 255
+        del rgb, alpha
+        return result
+
+    @staticmethod
+    def multiply_pixels(surface: Surface, color: ColorType) -> Surface:
+        """
+        multiply 的逐像素参考实现，仅在没有 numpy 时或对比结果时使用
+        """
+        def get_color(f, c):
+            if f // 255 == 0:
+                return c
+
+            return (f * c) // 255
+
+        blend_color = Blend.to_rgba(color)
+
         # 创建目标表面（保留原始格式和透明度）
         result = surface.copy()
 
@@ -65,4 +139,87 @@ class Blend:
         # 解锁表面
         result.unlock()
 
+        return result
+
+    @staticmethod
+    def tint(surface: Surface, color: ColorType) -> Surface:
+        """
+        标准的乘法着色: 每个通道按 s * c // 255 相乘，包括 alpha
+
+        没有 numpy 时使用 BLEND_RGBA_MULT，结果可能有 1 的误差
+        """
+        color = Blend.to_rgba(color)
+        result = surface.copy()
+
+        if not Blend._vectorized(result):
+            result.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+            return result
+
+        rgb, alpha = Blend._arrays(result)
+        rgb[...] = rgb.astype(numpy.uint16) * numpy.array(color[:3], numpy.uint16) // 255
+        if alpha is not None:
+            alpha[...] = alpha.astype(numpy.uint16) * color[3] // 255
+        del rgb, alpha
+        return result
+
+    @staticmethod
+    def alpha_multiply(surface: Surface, value: int) -> Surface:
+        """
+        只把 alpha 通道按 a * value // 255 相乘，RGB 不变
+
+        没有 numpy 时使用 BLEND_RGBA_MULT，结果可能有 1 的误差
+        """
+        result = surface.copy()
+
+        if not Blend._vectorized(result):
+            result.fill((255, 255, 255, value), special_flags=pygame.BLEND_RGBA_MULT)
+            return result
+
+        _, alpha = Blend._arrays(result)
+        if alpha is not None:
+            alpha[...] = alpha.astype(numpy.uint16) * value // 255
+        del alpha
+        return result
+
+    @staticmethod
+    def add(surface: Surface, color: ColorType) -> Surface:
+        """
+        RGB 通道与颜色相加并截断到 255，alpha 不变
+        """
+        r, g, b, _ = Blend.to_rgba(color)
+        result = surface.copy()
+        result.fill((r, g, b), special_flags=pygame.BLEND_RGB_ADD)
+        return result
+
+    @staticmethod
+    def screen(surface: Surface, color: ColorType) -> Surface:
+        """
+        滤色: 255 - (255 - s) * (255 - c) // 255，alpha 不变
+        """
+        Blend._require_numpy("screen")
+        color = Blend.to_rgba(color)
+        result = surface.copy()
+
+        rgb, _ = Blend._arrays(result)
+        inverse = 255 - numpy.array(color[:3], numpy.uint16)
+        rgb[...] = 255 - (255 - rgb.astype(numpy.uint16)) * inverse // 255
+        del rgb
+        return result
+
+    @staticmethod
+    def overlay(surface: Surface, color: ColorType) -> Surface:
+        """
+        叠加: s < 128 时为 2 * s * c // 255，否则为 255 - 2 * (255 - s) * (255 - c) // 255，alpha 不变
+        """
+        Blend._require_numpy("overlay")
+        color = Blend.to_rgba(color)
+        result = surface.copy()
+
+        rgb, _ = Blend._arrays(result)
+        source = rgb.astype(numpy.int32)
+        blend = numpy.array(color[:3], numpy.int32)
+        dark = 2 * source * blend // 255
+        light = 255 - 2 * (255 - source) * (255 - blend) // 255
+        rgb[...] = numpy.where(source < 128, dark, light)
+        del rgb
         return result
\ No newline at end of file
@@ -1,3 +1,3 @@
-﻿from src.Resources.Font.SysFont import SysFontResource
+﻿from src.Resources.Manager import ResourceManager_
 
-msyh_font = SysFontResource("msyh")
\ No newline at end of file
+msyh_font = ResourceManager_.sys_font("msyh")
\ No newline at end of file
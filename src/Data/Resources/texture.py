@@ -1,6 +1,6 @@
 ﻿from src.Data.path import in_assets
-from src.Resources.Texture import TextureResource
+from src.Resources.Manager import ResourceManager_
 
-close_resources = TextureResource(in_assets / "Texture" / "close.png")
+close_resources = ResourceManager_.texture(in_assets / "Texture" / "close.png", background=True)
 
-max_resources = TextureResource(in_assets / "Texture" / "max.png")
\ No newline at end of file
+max_resources = ResourceManager_.texture(in_assets / "Texture" / "max.png", background=True)
\ No newline at end of file
@@ -1,11 +1,15 @@
 ﻿from src.Blend import Blend
 from src.Data.Resources.texture import close_resources, max_resources
 from src.Surface import SurfaceRender
+from src.Surface.atlas import SurfaceAtlas
 
-close_surface = SurfaceRender(close_resources.res)
+close_surface = SurfaceRender(close_resources)
 
-red_close_surface = SurfaceRender(Blend.multiply(close_resources.res, "red"))
+red_close_surface = SurfaceRender(close_resources, lambda surface: Blend.cached("multiply", surface, "red"))
 
-max_surface = SurfaceRender(max_resources.res)
+max_surface = SurfaceRender(max_resources)
 
-red_max_surface = SurfaceRender(Blend.multiply(max_resources.res, "red"))
\ No newline at end of file
+red_max_surface = SurfaceRender(max_resources, lambda surface: Blend.cached("multiply", surface, "red"))
+
+# 标题栏按钮总是以相同尺寸一起绘制，打包进同一张图集
+button_atlas = SurfaceAtlas({"close": red_close_surface, "max": red_max_surface})
\ No newline at end of file
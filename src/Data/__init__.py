@@ -1 +1,3 @@
-import src.Data.Fonts
+from src.Lazy import lazy_package
+
+__getattr__, __dir__ = lazy_package(__name__, ("Fonts", "Resources", "Surface", "path"))
@@ -9,6 +9,8 @@ from src.Window.Independence import IndependenceWindow
 
 
 class WindowTestOne(IndependenceWindow):
+    RETAINED = True
+
     def __init__(self) -> None:
         super().__init__(1280, 720, "test1")
         self.add("test1", EmbeddedTestOne())
@@ -19,9 +21,8 @@ class WindowTestOne(IndependenceWindow):
         if event.IsKeyDown(KeyCode.K_2):
             self.parent.switch("test2")
 
-    def render(self) -> None:
-        super().render()
+    def paint(self, surface: Surface) -> None:
         font = Surface(Display.get_global_size(400, 400))
         font.fill(MColor("Blue").to())
         rect = font.get_rect(topleft=(0, 0))
-        self.box.blit(font, rect)
\ No newline at end of file
+        surface.blit(font, rect)
\ No newline at end of file
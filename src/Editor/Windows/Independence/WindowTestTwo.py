@@ -8,6 +8,8 @@ from src.Window.Independence import IndependenceWindow
 
 
 class WindowTestTwo(IndependenceWindow):
+    RETAINED = True
+
     def __init__(self) -> None:
         super().__init__(720, 720, "test2")
         self.add("test1", EmbeddedTestTwo())
@@ -18,9 +20,8 @@ class WindowTestTwo(IndependenceWindow):
         if event.IsKeyDown(KeyCode.K_1):
             self.parent.switch("test1")
 
-    def render(self) -> None:
-        super().render()
+    def paint(self, surface: Surface) -> None:
         font = Surface((400, 400))
         font.fill(MColor("yellow").to())
         rect = font.get_rect(topleft=(0, 0))
-        self.box.blit(font, rect)
\ No newline at end of file
+        surface.blit(font, rect)
\ No newline at end of file
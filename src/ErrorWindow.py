@@ -1,10 +1,10 @@
 ﻿import pygame
 import traceback
-import pyperclip
 from datetime import datetime
 
 from src.Color import MColor
 from src.Data.Fonts import msyh_font
+from src.Libs.Window.display import Display
 
 
 class ErrorWindow:
@@ -12,6 +12,7 @@ class ErrorWindow:
         pygame.init()
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Error occurred!")
+        Display.context.update()
 
         # 颜色配置
         self.theme = {
@@ -124,6 +125,8 @@ class ErrorWindow:
                         self.running = False
                     if self.button_rect_2.collidepoint(mouse_pos):
                         try:
+                            # 只有点击复制时才需要 pyperclip
+                            import pyperclip
                             pyperclip.copy(self.get_friendly_message())
                         except Exception as e:
                             print(f"Error: {e}")
@@ -0,0 +1,113 @@
+﻿from typing import Any, Callable
+
+import pygame
+
+from src.InputSystem.InputAction import InputAction
+
+Handler = Callable[[InputAction], None]
+
+POINTER_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL))
+KEY_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP))
+BUTTON_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
+
+class EventDispatcher:
+    def __init__(self, resolver: Callable[[tuple[int, int]], Any] | None = None) -> None:
+        """
+        按事件类型索引的事件分发器，每个事件只会交给订阅了它的处理函数
+
+        带 owner 的订阅只接收发给该 owner 的鼠标和键盘事件：
+        鼠标事件交给正在捕获鼠标的 owner，没有捕获时交给 resolver 根据坐标找到的 owner；
+        键盘事件交给最后一次被左键点击的 owner (focus)
+
+        参数:
+            resolver (Callable, optional): 根据鼠标坐标返回最上层 owner 的函数
+        """
+        self.resolver = resolver
+        self.focus = None
+        self.capture = None
+
+        self._handlers: dict[int, dict[int | None, list[tuple[Handler, Any]]]] = {}
+
+    def subscribe(self, event_type: int, handler: Handler, detail: int | None = None, owner: Any = None) -> None:
+        """
+        订阅事件
+
+        参数:
+            event_type (int): pygame 事件类型
+            handler (Callable): 处理函数，参数为 InputAction
+            detail (int, optional): 只接收指定按键 (KEYDOWN / KEYUP) 或鼠标按钮 (MOUSEBUTTONDOWN / MOUSEBUTTONUP) 的事件
+            owner (Any, optional): 订阅者所属的窗口，为 None 时接收所有事件
+        """
+        self._handlers.setdefault(event_type, {}).setdefault(detail, []).append((handler, owner))
+
+    def unsubscribe(self, owner: Any) -> None:
+        """
+        移除 owner 的全部订阅
+        """
+        for details in self._handlers.values():
+            for detail, handlers in details.items():
+                details[detail] = [item for item in handlers if item[1] is not owner]
+
+        if self.focus is owner:
+            self.focus = None
+        if self.capture is owner:
+            self.capture = None
+
+    def release(self, owner: Any) -> None:
+        """
+        owner 正在捕获鼠标时取消捕获
+        """
+        if self.capture is owner:
+            self.capture = None
+
+    def target(self, event: pygame.event.Event) -> Any:
+        if self.capture is not None:
+            return self.capture
+
+        pos = getattr(event, "pos", None)
+        if pos is None or self.resolver is None:
+            return self.focus
+        return self.resolver(pos)
+
+    def dispatch(self, event: InputAction) -> None:
+        raw = event.event
+        details = self._handlers.get(raw.type)
+        if not details:
+            return
+
+        if raw.type in KEY_EVENTS:
+            detail = raw.key
+        elif raw.type in BUTTON_EVENTS:
+            detail = raw.button
+        else:
+            detail = None
+
+        handlers = details.get(None, [])
+        if detail is not None and detail in details:
+            handlers = details[detail] + handlers
+        if not handlers:
+            return
+
+        if raw.type in POINTER_EVENTS:
+            target = self.target(raw)
+            # 只有左键点击改变焦点，右键和滚轮 (按钮 4/5) 不会
+            if raw.type == pygame.MOUSEBUTTONDOWN and raw.button == 1:
+                self.focus = target
+        elif raw.type in KEY_EVENTS:
+            target = self.focus
+        else:
+            # 其它事件不区分窗口，交给所有订阅者
+            for handler, _ in handlers:
+                handler(event)
+            return
+
+        for handler, owner in handlers:
+            if owner is None or owner is target:
+                handler(event)
+
+    def __len__(self) -> int:
+        return sum(len(handlers) for details in self._handlers.values() for handlers in details.values())
+
+    def __repr__(self) -> str:
+        return f"<EventDispatcher handlers:{len(self)} focus:{self.focus} capture:{self.capture}>"
\ No newline at end of file
@@ -14,25 +14,36 @@ class InputAction:
 
     @property
     def mouseMotion(self) -> bool:
-        return self.event.type == KeyCode.MOUSEMOTION.value
+        return self.event.type == pygame.MOUSEMOTION
+
+    @property
+    def windowExposed(self) -> bool:
+        return self.event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED,
+                                   pygame.WINDOWSIZECHANGED, pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED)
 
     @property
     def mousePosition(self) -> vec2:
+        """
+        鼠标事件使用事件发生时记录的位置，其它事件使用当前鼠标位置
+        """
+        pos = getattr(self.event, "pos", None)
+        if pos is not None:
+            return vec2(pos)
         return self.GetMousePosition()
 
     @staticmethod
     def GetMousePosition() -> vec2:
         return vec2(pygame.mouse.get_pos())
 
-    def IsKeyDown(self, key: KeyCode) -> bool:
+    def IsKeyDown(self, key: KeyCode | int) -> bool:
         if self.event.type == pygame.KEYDOWN:
-            return self.event.key == key.value
+            return self.event.key == key
 
         return False
 
-    def IsKeyUp(self, key: KeyCode) -> bool:
+    def IsKeyUp(self, key: KeyCode | int) -> bool:
         if self.event.type == pygame.KEYUP:
-            return self.event.key == key.value
+            return self.event.key == key
 
         return False
 
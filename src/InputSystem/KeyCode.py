@@ -1,7 +1,7 @@
-﻿from enum import Enum
+﻿from enum import Enum, IntEnum
 
 
-class KeyCode(Enum):
+class KeyCode(IntEnum):
     ACTIVEEVENT = 32768
 
     ANYFORMAT = 268435456
@@ -599,12 +599,8 @@ class KeyCode(Enum):
 
     SCALED = 512
 
-    SCRAP_BMP = 'image/bmp'
     SCRAP_CLIPBOARD = 0
-    SCRAP_PBM = 'image/pbm'
-    SCRAP_PPM = 'image/ppm'
     SCRAP_SELECTION = 1
-    SCRAP_TEXT = 'text/plain'
 
     SHOWN = 64
 
@@ -657,4 +653,16 @@ class KeyCode(Enum):
     WINDOWRESTORED = 32782
     WINDOWSHOWN = 32774
     WINDOWSIZECHANGED = 32779
-    WINDOWTAKEFOCUS = 32788
\ No newline at end of file
+    WINDOWTAKEFOCUS = 32788
+
+
+class ScrapType(Enum):
+    SCRAP_BMP = 'image/bmp'
+    SCRAP_PBM = 'image/pbm'
+    SCRAP_PPM = 'image/ppm'
+    SCRAP_TEXT = 'text/plain'
+
+
+# 剪贴板类型是字符串，不能放进 IntEnum，仍然可以通过 KeyCode.SCRAP_* 访问
+for _scrap in ScrapType:
+    setattr(KeyCode, _scrap.name, _scrap)
\ No newline at end of file
@@ -0,0 +1,92 @@
+﻿import pygame
+
+
+class InputState:
+    # 按键码到位序号的映射，第一次遇到某个按键时分配；按键码本身可能是很大的 Unicode 或扫描码，不能直接作为位序号
+    _slots: dict[int, int] = {}
+
+    def __init__(self) -> None:
+        """
+        每帧由 InputSystem 根据事件列表更新一次的输入快照，按键和鼠标按钮用整数位集保存，查询都是 O(1)
+        """
+        self.pressed = 0
+        self.down = 0
+        self.up = 0
+
+        self.mouse_pressed = 0
+        self.mouse_down = 0
+        self.mouse_up = 0
+        self.mouse_pos = 0, 0
+        self.mouse_rel = 0, 0
+        self.wheel = 0
+
+    @staticmethod
+    def bit(key: int) -> int:
+        slot = InputState._slots.get(key)
+        if slot is None:
+            slot = InputState._slots[key] = len(InputState._slots)
+        return 1 << slot
+
+    def begin(self) -> None:
+        """
+        开始新的一帧，清空只在一帧内有效的状态
+        """
+        self.down = 0
+        self.up = 0
+        self.mouse_down = 0
+        self.mouse_up = 0
+        self.mouse_rel = 0, 0
+        self.wheel = 0
+
+    def feed(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            bit = self.bit(event.key)
+            self.pressed |= bit
+            self.down |= bit
+        elif event.type == pygame.KEYUP:
+            bit = self.bit(event.key)
+            self.pressed &= ~bit
+            self.up |= bit
+        elif event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            self.mouse_rel = self.mouse_rel[0] + event.rel[0], self.mouse_rel[1] + event.rel[1]
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.mouse_pos = event.pos
+            self.mouse_pressed |= 1 << event.button
+            self.mouse_down |= 1 << event.button
+        elif event.type == pygame.MOUSEBUTTONUP:
+            self.mouse_pos = event.pos
+            self.mouse_pressed &= ~(1 << event.button)
+            self.mouse_up |= 1 << event.button
+        elif event.type == pygame.MOUSEWHEEL:
+            self.wheel += event.y
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # 失去焦点后收不到松开事件，避免按键卡住
+            self.pressed = 0
+            self.mouse_pressed = 0
+
+    def update(self, events: list[pygame.event.Event]) -> None:
+        self.begin()
+        for event in events:
+            self.feed(event)
+
+    def IsKeyPressed(self, key: int) -> bool:
+        return bool(self.pressed & self.bit(key))
+
+    def IsKeyDown(self, key: int) -> bool:
+        return bool(self.down & self.bit(key))
+
+    def IsKeyUp(self, key: int) -> bool:
+        return bool(self.up & self.bit(key))
+
+    def IsMousePressed(self, button: int = 1) -> bool:
+        return bool(self.mouse_pressed & 1 << button)
+
+    def IsMouseDown(self, button: int = 1) -> bool:
+        return bool(self.mouse_down & 1 << button)
+
+    def IsMouseUp(self, button: int = 1) -> bool:
+        return bool(self.mouse_up & 1 << button)
+
+    def __repr__(self) -> str:
+        return f"<InputState pressed:{self.pressed:#x} mouse:{self.mouse_pos} buttons:{self.mouse_pressed:#b}>"
\ No newline at end of file
@@ -1,12 +1,56 @@
 ﻿import pygame
 from typing import Generator, Any
 from src.InputSystem.InputAction import InputAction
+from src.InputSystem.State import InputState
 
 
 class InputSystem:
-    def __init__(self) -> None:
+    # 同一帧内只需要保留最后一个的窗口事件
+    LATEST_ONLY = frozenset((pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED,
+                             pygame.WINDOWEXPOSED, pygame.WINDOWMOVED))
+
+    # 所有窗口共用的每帧输入快照，在 Get 中更新
+    state = InputState()
+
+    def __init__(self, coalesce: bool = False) -> None:
+        """
+        参数:
+            coalesce (bool): 是否合并连续的鼠标移动事件和重复的窗口事件
+        """
         self.event = None
+        self.coalesce = coalesce
+        self.coalesced = 0
+
+    @staticmethod
+    def Coalesce(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+        """
+        合并连续的 MOUSEMOTION（rel 累加，pos 与 buttons 取最后一个），
+        LATEST_ONLY 中的事件每种只保留最后一个；按键和鼠标按钮事件的顺序保持不变
+        """
+        last = {}
+        for index, event in enumerate(events):
+            if event.type in InputSystem.LATEST_ONLY:
+                last[event.type] = index
+
+        result = []
+        for index, event in enumerate(events):
+            if event.type in last and last[event.type] != index:
+                continue
+
+            if event.type == pygame.MOUSEMOTION and result and result[-1].type == pygame.MOUSEMOTION:
+                previous = result[-1]
+                rel = previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1]
+                result[-1] = pygame.event.Event(pygame.MOUSEMOTION, event.dict, rel=rel)
+                continue
+
+            result.append(event)
+        return result
 
     def Get(self) -> Generator[InputAction, Any, None]:
         self.event = pygame.event.get()
+        if self.coalesce:
+            count = len(self.event)
+            self.event = self.Coalesce(self.event)
+            self.coalesced += count - len(self.event)
+        self.state.update(self.event)
         return (InputAction(event) for event in self.event)
\ No newline at end of file
@@ -1,5 +1,4 @@
 ﻿import sys
-from src.ErrorWindow import ErrorWindow
 from src.Libs.Error import get_traceback
 
 
@@ -9,6 +8,7 @@ def launch(func):
             return func(*args, **kwargs)
         except Exception as e:
             print(f"{e}: {get_traceback(e)}")
+            from src.ErrorWindow import ErrorWindow
             w = ErrorWindow(e)
             sys.exit(1)
 
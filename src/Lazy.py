@@ -0,0 +1,27 @@
+﻿import importlib
+from typing import Any, Callable, Iterable
+
+
+def lazy_package(package: str, names: Iterable[str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    生成包的 __getattr__ 和 __dir__，子模块在第一次被访问时才导入
+
+    参数:
+        package (str): 包名，一般传入 __name__
+        names (Iterable[str]): 可以延迟导入的子模块名称
+
+    返回:
+        tuple: (__getattr__, __dir__)
+    """
+    names = frozenset(names)
+
+    def __getattr__(name: str) -> Any:
+        if name in names:
+            # import_module 会把子模块设置为包的属性，之后不再经过 __getattr__
+            return importlib.import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted(names | set(importlib.import_module(package).__dict__))
+
+    return __getattr__, __dir__
\ No newline at end of file
@@ -5,6 +5,8 @@ import shutil
 from pathlib import Path
 from typing import Iterator, Any, Union, Optional
 
+from src.Libs.File.index import FolderIndex
+
 
 class FileStream:
     def __init__(self, file_path: str | Path) -> None:
@@ -126,6 +128,9 @@ class DirectoryInfo:
 class FolderStream:
     def __init__(self, folder_path: str | Path) -> None:
         self._path = os.path.normpath(str(folder_path))
+        self._index: FolderIndex | None = None
+        # 为 True 时下一次查询前刷新索引
+        self._stale = False
 
     @property
     def path(self) -> str:
@@ -137,12 +142,20 @@ class FolderStream:
 
     def create(self) -> "FolderStream":
         os.makedirs(self._path, exist_ok=True)
+        self.invalidate()
         return self
 
     def delete(self) -> "FolderStream":
         shutil.rmtree(self._path, ignore_errors=True)
+        self._index = None
         return self
 
+    def invalidate(self) -> None:
+        """
+        文件夹树被修改后调用，下一次查询时按文件夹修改时间刷新索引
+        """
+        self._stale = True
+
     def walk(self) -> Union[DirectoryInfo, None]:
         if not self.exists: return None
 
@@ -162,6 +175,66 @@ class FolderStream:
 
         return DirectoryInfo(self._path, folders, files)
 
+    def scan(self, recursive: bool = True, folders: bool = False) -> Iterator[os.DirEntry]:
+        """
+        用 os.scandir 逐个产生文件夹中的条目，边遍历边返回，不会先列出整棵树
+
+        参数:
+            recursive (bool): 是否进入子文件夹
+            folders (bool): 是否同时产生文件夹条目
+        """
+        stack = [self._path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                            if folders:
+                                yield entry
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
+
+    def index(self, parallel: bool = False, workers: int | None = None, refresh: bool = False) -> FolderIndex:
+        """
+        返回文件夹树的索引，第一次调用时建立；之后只在 refresh 为 True 或 invalidate 之后才刷新，
+        刷新需要 stat 每个文件夹，不在每次查询时进行
+
+        参数:
+            parallel (bool): 第一次建立索引时是否并行扫描
+            workers (int, optional): 并行扫描的线程数量
+            refresh (bool): 是否按文件夹修改时间刷新已有的索引
+        """
+        if self._index is None:
+            self._index = FolderIndex(self._path, parallel, workers)
+        elif refresh or self._stale:
+            self._index.refresh()
+        self._stale = False
+        return self._index
+
+    def find_files(self, name: str | None = None, suffix: str | None = None, refresh: bool = False) -> list[FileStream]:
+        """
+        通过索引在整棵文件夹树中查找文件
+
+        参数:
+            name (str, optional): 文件名
+            suffix (str, optional): 后缀，例如 ".png"
+            refresh (bool): 查找前是否刷新索引
+        """
+        index = self.index(refresh=refresh)
+        if name is not None:
+            paths = index.find(name)
+            if suffix is not None:
+                paths = [path for path in paths if path.lower().endswith(suffix.lower())]
+        elif suffix is not None:
+            paths = index.suffix(suffix)
+        else:
+            paths = list(index)
+        return [FileStream(path) for path in paths]
+
     @staticmethod
     def abs(source) -> Optional[str]:
         if isinstance(source, FolderStream):
@@ -173,13 +246,18 @@ class FolderStream:
         else:
             return None
 
-    def find_file(self, file_name):
-        file = None
-        for files in self.walk().files:
-            if files.name == file_name:
-                file = files
+    def find_file(self, file_name) -> Optional[FileStream]:
+        # 建立过索引时直接查索引，否则找到第一个就返回
+        if self._index is not None:
+            for path in self.index().find(file_name):
+                if os.path.dirname(path) == self._path:
+                    return FileStream(path)
+            return None
 
-        return file
+        for entry in self.scan(recursive=False):
+            if entry.name == file_name:
+                return FileStream(entry.path)
+        return None
 
     def __repr__(self) -> str:
         return f"<FolderStream: {self._path}>"
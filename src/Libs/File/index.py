@@ -0,0 +1,169 @@
+﻿import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator
+
+
+class FolderIndex:
+    def __init__(self, root: str, parallel: bool = False, workers: int | None = None) -> None:
+        """
+        文件夹树的内存索引，按文件名和后缀查找文件
+
+        每个文件夹记录扫描时的修改时间，refresh 只 stat 文件夹，只有修改时间变化的文件夹才重新列出
+
+        参数:
+            root (str): 根文件夹
+            parallel (bool): 是否用多个线程同时扫描不同的文件夹，适合很大的资源目录
+            workers (int, optional): 并行扫描的线程数量，默认为 min(32, CPU 核心数 + 4)
+        """
+        self.root = os.path.normpath(root)
+        self.parallel = parallel
+        self.workers = workers
+
+        self.listed = 0
+        self.refreshes = 0
+
+        # 文件夹 -> (修改时间, 文件名列表, 子文件夹路径列表)
+        self._dirs: dict[str, tuple[int, list[str], list[str]]] = {}
+        self._names: dict[str, list[str]] | None = None
+        self._suffixes: dict[str, list[str]] | None = None
+
+        self._scan([self.root])
+
+    def _list(self, path: str) -> tuple[int, list[str], list[str]] | None:
+        try:
+            # 先取修改时间再列出，列出期间发生的修改会在下一次 refresh 时发现
+            mtime = os.stat(path).st_mtime_ns
+            files = []
+            folders = []
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.name)
+        except OSError:
+            return None
+        return mtime, files, folders
+
+    def _scan(self, roots: list[str]) -> None:
+        if not self.parallel:
+            stack = list(roots)
+            while stack:
+                path = stack.pop()
+                result = self._list(path)
+                if result is not None:
+                    self._dirs[path] = result
+                    self.listed += 1
+                    stack.extend(result[2])
+            return
+
+        # os.scandir 在系统调用期间释放 GIL，多个文件夹可以同时列出，结果只在当前线程中写入
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = {pool.submit(self._list, path): path for path in roots}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    result = future.result()
+                    if result is None:
+                        continue
+                    self._dirs[path] = result
+                    self.listed += 1
+                    for folder in result[2]:
+                        pending[pool.submit(self._list, folder)] = folder
+
+    def _remove(self, path: str) -> None:
+        prefix = path + os.sep
+        for folder in [folder for folder in self._dirs if folder == path or folder.startswith(prefix)]:
+            del self._dirs[folder]
+
+    def refresh(self) -> bool:
+        """
+        检查所有文件夹的修改时间，重新列出发生变化的文件夹
+
+        返回:
+            bool: 索引是否发生了变化
+        """
+        changed = []
+        for path, (mtime, _, _) in self._dirs.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    changed.append(path)
+            except OSError:
+                changed.append(path)
+        if not changed:
+            return False
+
+        for path in changed:
+            if path not in self._dirs:
+                # 已经随上层文件夹一起被移除
+                continue
+            old = set(self._dirs[path][2])
+            result = self._list(path)
+            if result is None:
+                self._remove(path)
+                continue
+
+            self._dirs[path] = result
+            self.listed += 1
+            new = set(result[2])
+            for folder in old - new:
+                self._remove(folder)
+            self._scan([folder for folder in result[2] if folder not in old])
+
+        self._names = None
+        self._suffixes = None
+        self.refreshes += 1
+        return True
+
+    def _build(self) -> None:
+        names: dict[str, list[str]] = {}
+        suffixes: dict[str, list[str]] = {}
+        for path, (_, files, _) in self._dirs.items():
+            for name in files:
+                file = os.path.join(path, name)
+                names.setdefault(name, []).append(file)
+                suffixes.setdefault(os.path.splitext(name)[1].lower(), []).append(file)
+        self._names = names
+        self._suffixes = suffixes
+
+    def find(self, name: str) -> list[str]:
+        """
+        返回:
+            list[str]: 所有名为 name 的文件路径 (副本)
+        """
+        if self._names is None:
+            self._build()
+        return list(self._names.get(name, ()))
+
+    def suffix(self, suffix: str) -> list[str]:
+        """
+        参数:
+            suffix (str): 后缀，包括点号，例如 ".png"，不区分大小写
+
+        返回:
+            list[str]: 所有该后缀的文件路径 (副本)
+        """
+        if self._suffixes is None:
+            self._build()
+        return list(self._suffixes.get(suffix.lower(), ()))
+
+    def files(self, path: str | None = None) -> list[str]:
+        """
+        返回:
+            list[str]: 文件夹 path (默认为根文件夹) 中直接包含的文件路径，不包括子文件夹
+        """
+        path = os.path.normpath(path) if path is not None else self.root
+        entry = self._dirs.get(path)
+        return [os.path.join(path, name) for name in entry[1]] if entry else []
+
+    def __iter__(self) -> Iterator[str]:
+        for path, (_, files, _) in self._dirs.items():
+            for name in files:
+                yield os.path.join(path, name)
+
+    def __len__(self) -> int:
+        return sum(len(files) for _, files, _ in self._dirs.values())
+
+    def __repr__(self) -> str:
+        return f"<FolderIndex: {self.root} folders:{len(self._dirs)} files:{len(self)} refreshes:{self.refreshes}>"
\ No newline at end of file
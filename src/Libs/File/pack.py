@@ -0,0 +1,295 @@
+﻿import hashlib
+import io
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator
+
+
+class PackStream(io.RawIOBase):
+    def __init__(self, view: memoryview, name: str = "") -> None:
+        """
+        只读的文件对象，直接从 memoryview 读取，可以传给 pygame.image.load 等需要文件对象的接口
+
+        参数:
+            view (memoryview): 资源数据
+            name (str): 资源名称
+        """
+        super().__init__()
+        self._view = view
+        self._pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), len(self._view) - self._pos)
+        if size <= 0:
+            return 0
+        buffer[:size] = self._view[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class PackEntry:
+    __slots__ = ("name", "offset", "size", "digest")
+
+    def __init__(self, name: str, offset: int, size: int, digest: bytes) -> None:
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.digest = digest
+
+    def __repr__(self) -> str:
+        return f"<PackEntry {self.name} offset:{self.offset} size:{self.size}>"
+
+
+class PackFormat:
+    MAGIC = b"SAXP"
+    VERSION = 1
+    # 魔数、版本、资源数量、索引字节数
+    HEADER = struct.Struct("<4sIII")
+    # 名称长度；名称之后是偏移、大小、哈希
+    NAME = struct.Struct("<H")
+    ENTRY = struct.Struct("<QQ16s")
+    # 每个资源的数据按 16 字节对齐
+    ALIGN = 16
+
+    @staticmethod
+    def digest(data) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    @staticmethod
+    def align(offset: int) -> int:
+        return (offset + PackFormat.ALIGN - 1) // PackFormat.ALIGN * PackFormat.ALIGN
+
+
+class PackWriter:
+    def __init__(self, path: str | Path) -> None:
+        """
+        把多个资源写入一个打包文件，文件开头是索引 (名称、偏移、大小、哈希)，之后是对齐的资源数据
+
+        资源在 close 时才写入，可以用 with 语句
+
+        参数:
+            path (str | Path): 打包文件路径
+        """
+        self.path = Path(path)
+        self._sources: dict[str, bytes | Path] = {}
+
+    def add(self, name: str, data: bytes) -> "PackWriter":
+        self._sources[name.replace("\\", "/")] = bytes(data)
+        return self
+
+    def add_file(self, name: str, path: str | Path) -> "PackWriter":
+        self._sources[name.replace("\\", "/")] = Path(path)
+        return self
+
+    def add_folder(self, folder: str | Path, prefix: str = "") -> "PackWriter":
+        """
+        添加文件夹中的所有文件，名称为相对于 folder 的路径，用 / 分隔
+        """
+        folder = Path(folder)
+        for root, _, files in os.walk(folder):
+            for file in sorted(files):
+                path = Path(root) / file
+                self.add_file(prefix + path.relative_to(folder).as_posix(), path)
+        return self
+
+    def close(self) -> Path:
+        """
+        写入打包文件，先写到临时文件再替换，中途失败不会留下不完整的文件
+
+        返回:
+            Path: 打包文件路径
+        """
+        names = list(self._sources)
+        encoded = [name.encode("utf-8") for name in names]
+        index_size = sum(PackFormat.NAME.size + len(name) + PackFormat.ENTRY.size for name in encoded)
+
+        offset = PackFormat.align(PackFormat.HEADER.size + index_size)
+        entries = []
+        datas = []
+        for name in names:
+            source = self._sources[name]
+            data = source.read_bytes() if isinstance(source, Path) else source
+            entries.append((offset, len(data), PackFormat.digest(data)))
+            datas.append(data)
+            offset = PackFormat.align(offset + len(data))
+
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as file:
+            file.write(PackFormat.HEADER.pack(PackFormat.MAGIC, PackFormat.VERSION, len(names), index_size))
+            for name, (start, size, digest) in zip(encoded, entries):
+                file.write(PackFormat.NAME.pack(len(name)))
+                file.write(name)
+                file.write(PackFormat.ENTRY.pack(start, size, digest))
+            for (start, _, _), data in zip(entries, datas):
+                file.write(b"\0" * (start - file.tell()))
+                file.write(data)
+        os.replace(tmp, self.path)
+        return self.path
+
+    def __enter__(self) -> "PackWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __repr__(self) -> str:
+        return f"<PackWriter: {self.path} entries:{len(self)}>"
+
+
+class PackReader:
+    def __init__(self, path: str | Path) -> None:
+        """
+        用 mmap 打开打包文件，只解析开头的索引，读取资源时不复制数据
+
+        参数:
+            path (str | Path): 打包文件路径
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空文件不能 mmap
+            self._file.close()
+            raise ValueError(f"{self.path} is not a pack file")
+        self._view = memoryview(self._mmap)
+        self.entries: dict[str, PackEntry] = {}
+
+        try:
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self) -> None:
+        view = self._view
+        if len(view) < PackFormat.HEADER.size:
+            raise ValueError(f"{self.path} is not a pack file")
+
+        magic, version, count, index_size = PackFormat.HEADER.unpack_from(view, 0)
+        if magic != PackFormat.MAGIC:
+            raise ValueError(f"{self.path} is not a pack file")
+        if version != PackFormat.VERSION:
+            raise ValueError(f"{self.path} has unsupported pack version {version}")
+
+        pos = PackFormat.HEADER.size
+        for _ in range(count):
+            length, = PackFormat.NAME.unpack_from(view, pos)
+            pos += PackFormat.NAME.size
+            name = bytes(view[pos:pos + length]).decode("utf-8")
+            pos += length
+            offset, size, digest = PackFormat.ENTRY.unpack_from(view, pos)
+            pos += PackFormat.ENTRY.size
+            if offset + size > len(view):
+                raise ValueError(f"{self.path} is truncated at {name}")
+            self.entries[name] = PackEntry(name, offset, size, digest)
+
+    def read(self, name: str) -> memoryview:
+        """
+        返回:
+            memoryview: 资源数据，直接指向 mmap，关闭 PackReader 之前需要释放
+        """
+        entry = self.entries[name]
+        return self._view[entry.offset:entry.offset + entry.size]
+
+    def read_bytes(self, name: str) -> bytes:
+        with self.read(name) as view:
+            return bytes(view)
+
+    def open(self, name: str) -> PackStream:
+        """
+        返回:
+            PackStream: 可以传给 pygame.image.load 的文件对象
+        """
+        return PackStream(self.read(name), name)
+
+    def load_image(self, name: str):
+        """
+        直接从打包文件中解码图片，用名称的后缀判断格式
+        """
+        import pygame
+
+        with self.open(name) as stream:
+            return pygame.image.load(stream, name)
+
+    def verify(self, name: str | None = None) -> bool:
+        """
+        检查资源的哈希，name 为 None 时检查所有资源
+        """
+        for entry in [self.entries[name]] if name is not None else self.entries.values():
+            with self.read(entry.name) as view:
+                if PackFormat.digest(view) != entry.digest:
+                    return False
+        return True
+
+    def close(self) -> None:
+        """
+        关闭文件，read 返回的 memoryview 还没有释放时抛出 BufferError
+
+        抛出 BufferError 时文件描述符仍会关闭 (mmap 不依赖它)，已读取的数据仍然可用，全部释放后可以再次调用 close
+        """
+        try:
+            if self._view is not None:
+                self._view.release()
+                self._view = None
+            self._mmap.close()
+        except BufferError:
+            # read 返回的切片直接引用 mmap，释放 _view 不会失败，关闭 mmap 时才会失败，恢复 _view 让 reader 保持可用
+            self._view = memoryview(self._mmap)
+            raise
+        finally:
+            self._file.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __enter__(self) -> "PackReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<PackReader: {self.path} entries:{len(self)}>"
\ No newline at end of file
@@ -49,6 +49,25 @@ class MPath:
 
         return Path(base_path)
 
+    @staticmethod
+    def cache_dir(name: str = "SaxEngine") -> Path:
+        """
+        获取可写的缓存目录
+
+        打包后 sys._MEIPASS 是每次启动都会重新解压的临时目录，所以改用用户目录下的缓存位置
+
+        参数:
+            name (str): 缓存目录名称
+
+        返回:
+            Path: 缓存目录路径（不保证已经存在）
+        """
+        if not getattr(sys, 'frozen', False):
+            return MPath.get() / ".cache"
+
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return Path(base) / name
+
     @staticmethod
     def change_directory(path) -> None:
         """
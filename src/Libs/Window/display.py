@@ -4,43 +4,101 @@ from pygame import Rect
 from src.Libs.Utils.types import vec2
 
 
+class ResolutionContext:
+    def __init__(self) -> None:
+        """
+        缓存当前显示尺寸以及各基准尺寸对应的缩放系数，只在显示尺寸变化时重新计算
+        """
+        self._size: tuple[int, int] | None = None
+        self._display_factors: dict[tuple, tuple[float, float, float, float]] = {}
+        self._surface_factors: dict[tuple, tuple[float, float, float, float]] = {}
+
+    @property
+    def size(self) -> tuple[int, int]:
+        if self._size is None:
+            self._size = pygame.display.get_surface().get_size()
+        return self._size
+
+    def update(self, size: tuple[int, int] | None = None) -> None:
+        """
+        显示尺寸变化后调用，默认重新读取当前显示表面的尺寸
+        """
+        self._size = tuple(size) if size else None
+        self._display_factors.clear()
+        self._surface_factors.clear()
+
+    @staticmethod
+    def compute(s_size: tuple[int, int], size: tuple) -> tuple[float, float, float, float]:
+        """
+        返回:
+            tuple: (放大宽度系数, 放大高度系数, 还原宽度系数, 还原高度系数)
+        """
+        s_width, s_height = s_size
+        return (s_width / size[0], s_height / size[1],
+                size[0] / s_width if s_width else 0.0,
+                size[1] / s_height if s_height else 0.0)
+
+    def factors(self, surface=None, size: tuple = (1280, 720)) -> tuple[float, float, float, float]:
+        if not surface:
+            try:
+                return self._display_factors[size]
+            except KeyError:
+                factors = self._display_factors[tuple(size)] = self.compute(self.size, size)
+                return factors
+            except TypeError:
+                return self.compute(self.size, size)
+
+        key = surface.get_size(), tuple(size)
+        factors = self._surface_factors.get(key)
+        if factors is None:
+            factors = self._surface_factors[key] = self.compute(key[0], size)
+        return factors
+
+
 class Display:
     default_size = 1280, 720
+    context = ResolutionContext()
+
     @staticmethod
     def get_global_width(width, surface=None, size: tuple = default_size) -> int:
-        if not surface:
-            surface = pygame.display.get_surface()
-        s_width, s_height = surface.get_size()
-        return int(s_width / size[0] * width)
+        return int(Display.context.factors(surface, size)[0] * width)
 
     @staticmethod
     def get_global_height(height, surface=None, size: tuple = default_size) -> int:
-        if not surface:
-            surface = pygame.display.get_surface()
-        s_width, s_height = surface.get_size()
-        return int(s_height / size[1] * height)
+        return int(Display.context.factors(surface, size)[1] * height)
 
     @staticmethod
     def get_global_size(width, height, surface=None, size: tuple = default_size) -> vec2:
-        return vec2(Display.get_global_width(width, surface, size), Display.get_global_height(height, surface, size))
+        x, y, _, _ = Display.context.factors(surface, size)
+        return vec2(int(x * width), int(y * height))
 
     @staticmethod
     def get_return_width(width, surface=None, size: tuple = default_size) -> int:
-        if not surface:
-            surface = pygame.display.get_surface()
-        s_width, s_height = surface.get_size()
-        return int(size[0] / s_width * width)
+        return int(Display.context.factors(surface, size)[2] * width)
 
     @staticmethod
     def get_return_height(height, surface=None, size: tuple = default_size) -> int:
-        if not surface:
-            surface = pygame.display.get_surface()
-        s_width, s_height = surface.get_size()
-        return int(size[1] / s_height * height)
+        return int(Display.context.factors(surface, size)[3] * height)
 
     @staticmethod
     def get_return_size(width, height, surface=None, size: tuple = default_size) -> vec2:
-        return vec2(Display.get_return_width(width, surface, size), Display.get_return_height(height, surface, size))
+        _, _, x, y = Display.context.factors(surface, size)
+        return vec2(int(x * width), int(y * height))
+
+    @staticmethod
+    def get_global_sizes(sizes, surface=None, size: tuple = default_size) -> list[vec2]:
+        x, y, _, _ = Display.context.factors(surface, size)
+        return [vec2(int(x * width), int(y * height)) for width, height in sizes]
+
+    @staticmethod
+    def get_return_sizes(sizes, surface=None, size: tuple = default_size) -> list[vec2]:
+        _, _, x, y = Display.context.factors(surface, size)
+        return [vec2(int(x * width), int(y * height)) for width, height in sizes]
+
+    @staticmethod
+    def get_global_rects(rects, surface=None, size: tuple = default_size) -> list[Rect]:
+        x, y, _, _ = Display.context.factors(surface, size)
+        return [Rect(int(x * left), int(y * top), int(x * width), int(y * height)) for left, top, width, height in rects]
 
     @staticmethod
     def center_object(parent_surface, child_surface) -> Rect:
@@ -1,5 +1,3 @@
-import src.Libs.Error
-import src.Libs.File
-import src.Libs.String
-import src.Libs.Utils
-import src.Libs.Window
+from src.Lazy import lazy_package
+
+__getattr__, __dir__ = lazy_package(__name__, ("Error", "File", "String", "Utils", "Window"))
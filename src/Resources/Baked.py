@@ -0,0 +1,172 @@
+﻿import hashlib
+import json
+import os
+import struct
+import threading
+import weakref
+from pathlib import Path
+
+import pygame
+from pygame import Surface
+
+from src.Libs.File.pack import PackReader
+from src.Libs.File.path import MPath
+
+
+class BakedAssets:
+    MANIFEST = "manifest.json"
+    VERSION = 2
+
+    def __init__(self, path: str | Path | None = None, root: str | Path | None = None, enabled: bool = True) -> None:
+        """
+        构建时烘焙好的贴图包，贴图以显示格式的原始像素保存，读取时从 mmap 复制原始像素生成 Surface，不需要解码 PNG
+
+        包中的 manifest.json 记录每张源贴图和预先生成的派生贴图 (着色、缩放)，派生贴图的键与 DerivedCache 相同
+
+        参数:
+            path (str | Path | None): 贴图包路径，默认为 MPath.get() / "Baked" / "assets.pack"，不存在时所有查询都返回 None
+            root (str | Path | None): 源贴图所在的文件夹，默认为 MPath.get() / manifest 中记录的源文件夹
+            enabled (bool): 为 False 时不读取贴图包
+        """
+        self._path = Path(path) if path is not None else None
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+
+        self._reader: PackReader | None = None
+        self._manifest: dict | None = None
+        self._root = Path(root).resolve() if root is not None else None
+        self._lock = threading.Lock()
+
+        # 从贴图包生成的 Surface -> 内容摘要，避免运行时重新计算
+        self._keys: weakref.WeakKeyDictionary[Surface, str] = weakref.WeakKeyDictionary()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = MPath.get() / "Baked" / "assets.pack"
+        return self._path
+
+    def manifest(self) -> dict:
+        """
+        第一次调用时打开贴图包，之后一直保持打开
+        """
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    self._manifest = self._open()
+        return self._manifest
+
+    def _open(self) -> dict:
+        empty = {"textures": {}, "derived": {}}
+        if not self.enabled or not self.path.is_file():
+            return empty
+
+        try:
+            # 索引被截断时 struct 会抛出 struct.error，PackReader 构造失败时自己会关闭文件
+            reader = PackReader(self.path)
+        except (OSError, ValueError, struct.error):
+            return empty
+
+        try:
+            manifest = json.loads(reader.read_bytes(self.MANIFEST))
+            if not isinstance(manifest, dict) or manifest.get("version") != self.VERSION:
+                raise ValueError(f"{self.path} has an unsupported manifest")
+        except (OSError, ValueError, KeyError):
+            reader.close()
+            return empty
+
+        self._reader = reader
+        if self._root is None:
+            self._root = (MPath.get() / manifest["source"]).resolve()
+        return manifest
+
+    def _surface(self, item: dict) -> Surface:
+        # mmap 是只读映射，直接指向它的 Surface 被写入时会崩溃，所以交出去的是副本
+        view = self._reader.read(item["entry"])
+        try:
+            surface = pygame.image.frombuffer(view, tuple(item["size"]), item["format"]).copy()
+        finally:
+            view.release()
+        self._keys[surface] = item["key"]
+        return surface
+
+    @staticmethod
+    def file_digest(path: str | Path) -> str:
+        """
+        返回:
+            str: 源文件内容的摘要，烘焙时记录，用来判断源文件是否在烘焙后被修改过
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _fresh(self, path: str | Path, item: dict) -> bool:
+        # 大小和修改时间都没变时直接使用；修改时间变了 (例如被复制到安装目录) 时再比较内容摘要
+        try:
+            stat = os.stat(path)
+            if stat.st_size != item["file_size"]:
+                return False
+            if stat.st_mtime_ns == item["file_mtime"]:
+                return True
+            return self.file_digest(path) == item["file_digest"]
+        except OSError:
+            # 源文件不存在时 (只发布了贴图包) 使用烘焙结果
+            return True
+
+    def texture(self, path: str | Path) -> Surface | None:
+        """
+        返回:
+            Surface | None: 源贴图对应的烘焙贴图，没有烘焙或源文件在烘焙后被修改过时为 None
+        """
+        textures = self.manifest()["textures"]
+        if not textures:
+            return None
+
+        try:
+            name = Path(path).resolve().relative_to(self._root).as_posix()
+        except (TypeError, ValueError):
+            self.misses += 1
+            return None
+
+        item = textures.get(name)
+        if item is None:
+            self.misses += 1
+            return None
+
+        # 开发时源文件可能在烘焙之后被修改，修改过就不使用烘焙结果
+        if not self._fresh(path, item):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._surface(item)
+
+    def derived(self, key: str) -> Surface | None:
+        """
+        返回:
+            Surface | None: DerivedCache 键对应的预先生成的派生贴图
+        """
+        item = self.manifest()["derived"].get(key)
+        if item is None:
+            return None
+        self.hits += 1
+        return self._surface(item)
+
+    def source_key(self, surface: Surface) -> str | None:
+        """
+        返回:
+            str | None: 由贴图包生成的 Surface 的内容摘要，与 DerivedCache.surface_key 的结果相同
+        """
+        return self._keys.get(surface)
+
+    def __repr__(self) -> str:
+        manifest = self._manifest or {"textures": {}, "derived": {}}
+        return (f"<BakedAssets path:{self.path} textures:{len(manifest['textures'])} "
+                f"derived:{len(manifest['derived'])} hits:{self.hits} misses:{self.misses}>")
+
+
+Baked_ = BakedAssets()
\ No newline at end of file
@@ -0,0 +1,110 @@
+﻿import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pygame
+from pygame import Surface
+from pygame.transform import scale
+
+from src.Blend import Blend
+from src.Libs.File.pack import PackWriter
+from src.Resources.Baked import BakedAssets
+from src.Surface.derived import DerivedCache
+
+
+class AssetBaker:
+    IMAGE_SUFFIXES = frozenset((".png", ".jpg", ".jpeg", ".bmp", ".tga", ".gif", ".webp"))
+
+    def __init__(self, source: str | Path, output: str | Path, textures: dict[str, dict] | None = None) -> None:
+        """
+        构建时把源文件夹中的贴图解码成原始像素，连同声明的派生贴图一起写入 BakedAssets 读取的贴图包
+
+        参数:
+            source (str | Path): 源文件夹，例如 "InternalResources"
+            output (str | Path): 贴图包路径
+            textures (dict, optional): 贴图相对路径 -> 派生声明，例如
+                {"blend": [["multiply", "red"]], "scales": [[17, 17]]}，缩放同时作用于源贴图和每个着色结果
+        """
+        self.source = Path(source)
+        self.output = Path(output)
+        self.textures = textures or {}
+
+        self._writer: PackWriter | None = None
+        self._manifest: dict | None = None
+
+    @classmethod
+    def from_config(cls, path: str | Path = "bake.json") -> "AssetBaker":
+        with open(path, encoding="utf-8") as file:
+            config = json.load(file)
+        return cls(config["source"], config["output"], config.get("textures"))
+
+    @staticmethod
+    def _args(value: Any) -> Any:
+        # JSON 中的数组转成元组，生成的键才会与运行时的参数一致
+        if isinstance(value, list):
+            return tuple(AssetBaker._args(item) for item in value)
+        return value
+
+    @staticmethod
+    def bakeable(surface: Surface) -> bool:
+        # 调色板和 colorkey 贴图转成原始像素后外观会变化，保留原文件
+        return surface.get_bitsize() in (24, 32) and surface.get_colorkey() is None
+
+    def _add(self, entry: str, surface: Surface, **extra: Any) -> dict:
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        # 带透明通道时按显示表面常见的 BGRA 字节序保存，convert_alpha 时不需要重新排列
+        fmt = "BGRA" if alpha else "RGB"
+        self._writer.add(entry, pygame.image.tobytes(surface, fmt))
+        return {"entry": entry, "size": list(surface.get_size()), "format": fmt,
+                "key": DerivedCache.surface_key(surface), **extra}
+
+    def _derive(self, key: str, build, *args) -> tuple[str, Surface]:
+        surface = build(*args)
+        item = self._add(f"derived/{key}", surface)
+        self._manifest["derived"][key] = item
+        return item["key"], surface
+
+    def _bake_texture(self, name: str, path: Path) -> None:
+        surface = pygame.image.load(path)
+        if not self.bakeable(surface):
+            return
+
+        stat = os.stat(path)
+        item = self._add(f"textures/{name}", surface, file_size=stat.st_size, file_mtime=stat.st_mtime_ns,
+                         file_digest=BakedAssets.file_digest(path))
+        self._manifest["textures"][name] = item
+
+        spec = self.textures.get(name, {})
+        targets = [(item["key"], surface)]
+        for mode, *args in spec.get("blend", ()):
+            args = self._args(args)
+            key = DerivedCache.key("Blend." + mode, item["key"], *args)
+            targets.append(self._derive(key, getattr(Blend, mode), surface, *args))
+
+        for size in spec.get("scales", ()):
+            size = self._args(size)
+            for source_key, target in targets:
+                self._derive(DerivedCache.key("SurfaceRender", source_key, size), scale, target, size)
+
+    def bake(self) -> Path:
+        """
+        返回:
+            Path: 写入的贴图包路径
+        """
+        self._writer = PackWriter(self.output)
+        self._manifest = {"version": BakedAssets.VERSION, "source": self.source.as_posix(), "textures": {}, "derived": {}}
+
+        for root, _, files in os.walk(self.source):
+            for file in sorted(files):
+                path = Path(root) / file
+                if path.suffix.lower() in self.IMAGE_SUFFIXES:
+                    self._bake_texture(path.relative_to(self.source).as_posix(), path)
+
+        self._writer.add(BakedAssets.MANIFEST, json.dumps(self._manifest).encode("utf-8"))
+        path = self._writer.close()
+        self._writer = None
+        return path
+
+    def __repr__(self) -> str:
+        return f"<AssetBaker {self.source} -> {self.output}>"
\ No newline at end of file
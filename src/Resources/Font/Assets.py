@@ -2,12 +2,36 @@
 from pygame import Surface
 
 from src.Libs.Utils.types import ColorType
+from src.Surface.cache import SurfaceCache
 
 
 class FontAssets:
+    cache = SurfaceCache(8 * 1024 * 1024, display_bound=False)
+
     def __init__(self, font: pygame.font.Font) -> None:
         self.font = font
 
-    def render(self, text: str, color: ColorType = "white", bg: ColorType = None) -> Surface:
-        pygame.init()
-        return self.font.render(text, True, color, bg)
\ No newline at end of file
+    @staticmethod
+    def _color_key(color: ColorType):
+        if color is None or isinstance(color, str):
+            return color
+        return tuple(color)
+
+    @classmethod
+    def discard(cls, font: pygame.font.Font) -> None:
+        """
+        移除某个字体对象缓存的文字，字体被 FontRegistry 淘汰或移除时调用
+        """
+        cls.cache.discard(font)
+
+    def _build(self, text: str, antialias: bool, color: ColorType, bg: ColorType) -> Surface:
+        return self.font.render(text, antialias, color, bg)
+
+    def render(self, text: str, color: ColorType = "white", bg: ColorType = None, antialias: bool = True) -> Surface:
+        """
+        渲染文字，相同的 (字体, 文字, 颜色, 背景色, 抗锯齿) 直接返回缓存的 Surface
+
+        返回的 Surface 会被多处共享，调用方不应修改它
+        """
+        key = self.font, text, self._color_key(color), self._color_key(bg), antialias
+        return self.cache.get(key, self._build, text, antialias, color, bg)
\ No newline at end of file
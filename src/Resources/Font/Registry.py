@@ -0,0 +1,101 @@
+﻿import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import pygame
+
+from src.Resources.Font.Assets import FontAssets
+
+
+class FontRegistry:
+    def __init__(self, capacity: int = 32) -> None:
+        """
+        共享的字体对象缓存，以 (字体, 像素大小, 粗体, 斜体) 为键，超出容量时按 LRU 淘汰
+
+        参数:
+            capacity (int): 最多缓存的字体对象数量
+        """
+        self.capacity = capacity
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._fonts: OrderedDict[tuple, pygame.font.Font] = OrderedDict()
+        self._data: dict[str, bytes] = {}
+        # 字体可能在资源加载线程中创建，SDL_ttf 不是线程安全的
+        self._lock = threading.RLock()
+
+    def sys_font(self, name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        return self._get(("sys", name, size, bold, italic), pygame.font.SysFont, name, size, bold, italic)
+
+    def file_font(self, path: str | Path | None, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        path = str(path) if path is not None else None
+        return self._get(("file", path, size, bold, italic), self._load_file, path, size, bold, italic)
+
+    def _load_file(self, path: str | None, size: int, bold: bool, italic: bool) -> pygame.font.Font:
+        if path is None:
+            font = pygame.font.Font(None, size)
+        else:
+            # 字体文件只读取一次，不同字号共用同一份数据
+            data = self._data.get(path)
+            if data is None:
+                with open(path, "rb") as file:
+                    data = self._data[path] = file.read()
+            font = pygame.font.Font(io.BytesIO(data), size)
+
+        font.bold = bold
+        font.italic = italic
+        return font
+
+    def _get(self, key: tuple, func: Callable[..., pygame.font.Font], *args: Any) -> pygame.font.Font:
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                self.hits += 1
+                return font
+
+            self.misses += 1
+            if not pygame.font.get_init():
+                # 字体资源可能在 Application 调用 pygame.init 之前 (例如导入时在加载线程中) 创建
+                pygame.font.init()
+            font = self._fonts[key] = func(*args)
+            while len(self._fonts) > self.capacity:
+                FontAssets.discard(self._fonts.popitem(last=False)[1])
+                self.evictions += 1
+
+            return font
+
+    def discard(self, kind: str, name: str | None) -> None:
+        """
+        移除某个字体的所有字号，以及它的字体文件数据
+
+        参数:
+            kind (str): "sys" 或 "file"
+            name (str): 系统字体名称或字体文件路径
+        """
+        with self._lock:
+            for key in [key for key in self._fonts if key[0] == kind and key[1] == name]:
+                FontAssets.discard(self._fonts.pop(key))
+            if kind == "file" and name is not None:
+                self._data.pop(name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            for font in self._fonts.values():
+                FontAssets.discard(font)
+            self._fonts.clear()
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def __repr__(self) -> str:
+        return (f"<FontRegistry fonts:{len(self)}/{self.capacity} files:{len(self._data)} "
+                f"hits:{self.hits} misses:{self.misses} evictions:{self.evictions}>")
+
+
+FontRegistry_ = FontRegistry()
\ No newline at end of file
@@ -1,23 +1,42 @@
-﻿from typing import Any
+﻿import os
+from typing import Any
 
 import pygame
 
 from src.Libs.Window.display import Display
 from src.Resources import Resource
 from src.Resources.Font import FontAssets
+from src.Resources.Font.Registry import FontRegistry_
 
 
 class SysFontResource(Resource):
     @staticmethod
-    def __load_func(font, size) -> pygame.font.Font:
-        return pygame.font.SysFont(font, size)
+    def __load_func(font, size, bold, italic) -> pygame.font.Font:
+        return FontRegistry_.sys_font(font, size, bold, italic)
 
-    def __init__(self, font) -> None:
+    def __init__(self, font, bold: bool = False, italic: bool = False, background: bool = False) -> None:
         self.font_size = 0
-        super().__init__(font, self.__load_func)
+        self.bold = bold
+        self.italic = italic
+        self._file = None
+        super().__init__(font, self.__load_func, background)
 
     def get_value(self) -> Any:
-        return self.func(self.path, self.font_size)
+        return self.func(self.path, self.font_size, self.bold, self.italic)
+
+    def nbytes(self) -> int:
+        if not self.isLoad:
+            return 0
+        if self._file is None:
+            self._file = pygame.font.match_font(self.path, self.bold, self.italic) or ""
+        try:
+            return os.path.getsize(self._file) if self._file else 0
+        except OSError:
+            return 0
+
+    def unload(self) -> None:
+        super().unload()
+        FontRegistry_.discard("sys", self.path)
 
     def render(self, size: int) -> FontAssets:
         self.font_size = Display.get_global_height(size)
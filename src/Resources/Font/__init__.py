@@ -1,22 +1,39 @@
-﻿import pygame
+﻿import os
+import pygame
 from typing import Any
 
 from src.Libs.Window.display import Display
 from src.Resources import Resource
 from src.Resources.Font.Assets import FontAssets
+from src.Resources.Font.Registry import FontRegistry_
 
 
 class FontResource(Resource):
     @staticmethod
-    def __load_func(path, size) -> pygame.font.Font:
-        return pygame.font.Font(path, size)
+    def __load_func(path, size, bold, italic) -> pygame.font.Font:
+        return FontRegistry_.file_font(path, size, bold, italic)
 
-    def __init__(self, path) -> None:
+    def __init__(self, path, bold: bool = False, italic: bool = False, background: bool = False) -> None:
         self.font_size = 0
-        super().__init__(path, self.__load_func)
+        self.bold = bold
+        self.italic = italic
+        super().__init__(path, self.__load_func, background)
 
     def get_value(self) -> Any:
-        return self.func(self.path, self.font_size)
+        return self.func(self.path, self.font_size, self.bold, self.italic)
+
+    def nbytes(self) -> int:
+        # 字体文件的数据由 FontRegistry 读入内存，所有字号共用
+        if not self.isLoad or self.path is None:
+            return 0
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def unload(self) -> None:
+        super().unload()
+        FontRegistry_.discard("file", str(self.path) if self.path is not None else None)
 
     def render(self, size: int) -> FontAssets:
         self.font_size = Display.get_global_height(size)
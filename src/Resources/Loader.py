@@ -0,0 +1,107 @@
+﻿import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+
+class LoadBatch:
+    def __init__(self, resources: list, callback: Callable[[int, int], None] | None = None) -> None:
+        """
+        一组同时预加载的资源
+
+        参数:
+            resources (list): 资源列表
+            callback (Callable, optional): 每完成一个资源调用一次 callback(已完成数量, 总数)，在加载线程中执行
+        """
+        self.resources = resources
+        self.callback = callback
+        self.total = len(resources)
+        self.loaded = 0
+        self.failed = 0
+
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        if not self.total:
+            self._event.set()
+
+        for resource in resources:
+            resource.add_done_callback(self._finish)
+
+    def _finish(self, resource) -> None:
+        with self._lock:
+            self.loaded += 1
+            if not resource.isLoad:
+                self.failed += 1
+            loaded = self.loaded
+            if loaded == self.total:
+                self._event.set()
+
+        if self.callback is not None:
+            self.callback(loaded, self.total)
+
+    @property
+    def progress(self) -> float:
+        """加载进度 (0.0-1.0)"""
+        return self.loaded / self.total if self.total else 1.0
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        等待全部资源加载完成
+
+        返回:
+            bool: 超时前是否全部完成
+        """
+        return self._event.wait(timeout)
+
+    def __repr__(self) -> str:
+        return f"<LoadBatch {self.loaded}/{self.total} failed:{self.failed}>"
+
+
+class ResourceLoader:
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        后台加载资源的线程池，第一次提交任务时才创建线程
+
+        pygame 解码图片时会释放 GIL，所以多个图片可以真正并行解码
+
+        参数:
+            max_workers (int, optional): 线程数量，默认为 min(4, CPU 核心数)
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="ResourceLoader")
+            return self._executor
+
+    def submit(self, func: Callable[..., Any], *args) -> Future:
+        self.submitted += 1
+        return self.executor.submit(func, *args)
+
+    @staticmethod
+    def preload(resources: Iterable, callback: Callable[[int, int], None] | None = None) -> LoadBatch:
+        """
+        跟踪一组资源的加载进度，资源本身需要以 background=True 创建，同步资源会立即计为完成
+        """
+        return LoadBatch(list(resources), callback)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait)
+                self._executor = None
+
+    def __repr__(self) -> str:
+        return f"<ResourceLoader workers:{self.max_workers} submitted:{self.submitted}>"
+
+
+Loader_ = ResourceLoader()
\ No newline at end of file
@@ -0,0 +1,179 @@
+﻿import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from src.Resources import Resource
+from src.Resources.Font import FontResource
+from src.Resources.Font.SysFont import SysFontResource
+from src.Resources.Texture import TextureResource
+
+
+class ResourceManager:
+    def __init__(self, budget: int = 256 * 1024 * 1024) -> None:
+        """
+        统一创建和管理资源：相同的资源只创建一次，窗口在 enter 中 acquire、在 exit 中 release
+
+        已加载资源占用的内存超出预算时，按最近最少使用的顺序释放没有被引用的资源，再次 acquire 时重新加载
+
+        参数:
+            budget (int): 内存预算 (字节)
+        """
+        self.budget = budget
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # 键 -> 资源，按最近使用的顺序排列
+        self._resources: OrderedDict[tuple, Resource] = OrderedDict()
+        self._refs: dict[tuple, int] = {}
+        self._bytes: dict[tuple, int] = {}
+        self._keys: dict[int, tuple] = {}
+
+        # 后台加载完成的回调在加载线程中执行
+        self._lock = threading.RLock()
+
+    def get(self, cls: type[Resource], path: Any, *args: Any, background: bool = False) -> Resource:
+        """
+        返回已有的资源，没有时创建
+
+        参数:
+            cls (type): 资源类型
+            path (Any): 资源路径或名称
+            *args: 资源类型的其它参数，也是去重的键的一部分
+            background (bool): 第一次创建时是否在后台加载
+        """
+        key = cls, str(path) if isinstance(path, Path) else path, args
+        with self._lock:
+            resource = self._resources.get(key)
+            if resource is not None:
+                self._resources.move_to_end(key)
+                self.hits += 1
+                self._reload(resource)
+                return resource
+
+            self.misses += 1
+            resource = cls(path, *args, background=background)
+            self._resources[key] = resource
+            self._refs[key] = 0
+            self._bytes[key] = 0
+            self._keys[id(resource)] = key
+
+        resource.add_done_callback(self._loaded)
+        return resource
+
+    def texture(self, path: Any, background: bool = False) -> TextureResource:
+        return self.get(TextureResource, path, background=background)
+
+    def font(self, path: Any, bold: bool = False, italic: bool = False, background: bool = False) -> FontResource:
+        return self.get(FontResource, path, bold, italic, background=background)
+
+    def sys_font(self, name: str, bold: bool = False, italic: bool = False, background: bool = False) -> SysFontResource:
+        return self.get(SysFontResource, name, bold, italic, background=background)
+
+    def _reload(self, resource: Resource) -> None:
+        if resource.state == Resource.UNLOADED:
+            resource.reload()
+            resource.add_done_callback(self._loaded)
+
+    def _loaded(self, resource: Resource) -> None:
+        # 在加载线程中执行，只记录占用的内存；释放资源会修改主线程正在使用的缓存，留到 end_frame 中进行
+        with self._lock:
+            key = self._keys.get(id(resource))
+            if key is None:
+                return
+            self._bytes[key] = resource.nbytes()
+
+    def acquire(self, resource: Resource) -> Resource:
+        """
+        增加资源的引用计数，资源已被释放时重新加载；不是由 ResourceManager 创建的资源原样返回
+        """
+        with self._lock:
+            key = self._keys.get(id(resource))
+            if key is None:
+                return resource
+            self._refs[key] += 1
+            self._resources.move_to_end(key)
+            self._reload(resource)
+        return resource
+
+    def release(self, resource: Resource) -> None:
+        """
+        减少资源的引用计数，没有引用后可以在超出预算时被释放
+        """
+        with self._lock:
+            key = self._keys.get(id(resource))
+            if key is None or not self._refs[key]:
+                return
+            self._refs[key] -= 1
+            if not self._refs[key]:
+                self.trim()
+
+    def end_frame(self) -> None:
+        """
+        每帧结束时在主线程调用，超出预算时释放没有被引用的资源
+        """
+        if self.memory > self.budget:
+            self.trim()
+
+    def refs(self, resource: Resource) -> int:
+        key = self._keys.get(id(resource))
+        return self._refs[key] if key is not None else 0
+
+    def trim(self, budget: int | None = None) -> int:
+        """
+        按最近最少使用的顺序释放没有被引用的资源，直到内存不超过预算
+
+        参数:
+            budget (int, optional): 临时使用的预算，默认为 self.budget
+
+        返回:
+            int: 释放的字节数
+        """
+        budget = self.budget if budget is None else budget
+        freed = 0
+        with self._lock:
+            memory = self.memory
+            for key, resource in self._resources.items():
+                if memory <= budget:
+                    break
+                if self._refs[key] or not self._bytes[key] or resource.state != Resource.LOADED:
+                    continue
+
+                resource.unload()
+                memory -= self._bytes[key]
+                freed += self._bytes[key]
+                self._bytes[key] = 0
+                self.evictions += 1
+        return freed
+
+    @property
+    def memory(self) -> int:
+        """已加载的资源占用的内存 (字节)"""
+        return sum(self._bytes.values())
+
+    def report(self) -> dict[str, dict[str, int]]:
+        """
+        返回:
+            dict: 按资源类型统计的 count (资源数量)、loaded (已加载数量)、referenced (被引用数量)、bytes (占用内存)
+        """
+        report = {}
+        with self._lock:
+            for key, resource in self._resources.items():
+                item = report.setdefault(key[0].__name__, {"count": 0, "loaded": 0, "referenced": 0, "bytes": 0})
+                item["count"] += 1
+                item["loaded"] += resource.state == Resource.LOADED
+                item["referenced"] += bool(self._refs[key])
+                item["bytes"] += self._bytes[key]
+        return report
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def __repr__(self) -> str:
+        return (f"<ResourceManager resources:{len(self)} memory:{self.memory}/{self.budget} "
+                f"hits:{self.hits} misses:{self.misses} evictions:{self.evictions}>")
+
+
+ResourceManager_ = ResourceManager()
\ No newline at end of file
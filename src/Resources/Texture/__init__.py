@@ -1,11 +1,26 @@
 ﻿import pygame
 from src.Resources import Resource
+from src.Resources.Baked import Baked_
 
 
 class TextureResource(Resource):
+    _placeholder: pygame.Surface | None = None
+
     @staticmethod
     def load_func(path) -> pygame.Surface:
-        return pygame.image.load(path)
+        # 优先使用构建时烘焙好的原始像素，不需要解码
+        surface = Baked_.texture(path)
+        return surface if surface is not None else pygame.image.load(path)
+
+    def __init__(self, path, background: bool = False) -> None:
+        super().__init__(path, self.load_func, background)
+
+    def nbytes(self) -> int:
+        surface = self.res if self.isLoad else None
+        return surface.get_pitch() * surface.get_height() if surface else 0
 
-    def __init__(self, path) -> None:
-        super().__init__(path, self.load_func)
\ No newline at end of file
+    def placeholder(self) -> pygame.Surface:
+        # 所有未加载完成的贴图共用一个透明的占位图
+        if TextureResource._placeholder is None:
+            TextureResource._placeholder = pygame.Surface((1, 1), pygame.SRCALPHA)
+        return TextureResource._placeholder
\ No newline at end of file
@@ -1,14 +1,58 @@
-﻿from typing import Any
+﻿import threading
+import weakref
+from typing import Any, Callable
+
 from src.Libs.Utils import Message
+from src.Resources.Loader import Loader_
 
 
 class Resource:
-    def __init__(self, path, func = None) -> None:
+    PENDING = "pending"
+    LOADED = "loaded"
+    FAILED = "failed"
+    UNLOADED = "unloaded"
+
+    def __init__(self, path, func = None, background: bool = False) -> None:
+        """
+        参数:
+            path: 资源路径
+            func (Callable, optional): 加载函数
+            background (bool): 为 True 时在 Loader_ 的线程池中加载，加载完成前 res 返回 placeholder()
+        """
         self.__path = path
         self.__res = None
         self.func = func
 
-        self.__isLoad, self.__errmsg = self.load()
+        self.__isLoad, self.__errmsg = False, None
+        self.__done = threading.Event()
+        self.__callbacks: list[Callable[["Resource"], None]] = []
+        self.__lock = threading.Lock()
+        self.__background = bool(background and func)
+        self.__unloaded = False
+        # 每次加载完成递增，使用方据此判断资源是否被重新加载过
+        self.__version = 0
+        self.__watchers: list[weakref.WeakMethod] = []
+
+        self.__start()
+
+    def __start(self) -> None:
+        if self.__background:
+            Loader_.submit(self.__background_load)
+        else:
+            self.__finish(self.load())
+
+    def __background_load(self) -> None:
+        self.__finish(self.load())
+
+    def __finish(self, message: Message[bool]) -> None:
+        with self.__lock:
+            self.__isLoad, self.__errmsg = message
+            self.__version += 1
+            self.__done.set()
+            callbacks, self.__callbacks = self.__callbacks, []
+
+        for callback in callbacks:
+            callback(self)
 
     def load(self) -> Message[bool]:
         try:
@@ -20,8 +64,107 @@ class Resource:
     def get_value(self) -> Any:
         return self.func(self.__path)
 
+    def unload(self) -> None:
+        """
+        释放已加载的资源，之后 res 返回 placeholder()，直到调用 reload 重新加载；正在加载时不做任何事
+        """
+        with self.__lock:
+            if not self.__done.is_set() or not self.func:
+                return
+            self.__res = None
+            self.__isLoad, self.__errmsg = False, None
+            self.__unloaded = True
+            watchers = [watcher() for watcher in self.__watchers]
+
+        for watcher in watchers:
+            if watcher is not None:
+                watcher(self)
+
+    def watch(self, method: Callable[["Resource"], None]) -> None:
+        """
+        资源被 unload 时调用 method(resource)，用于释放由资源生成的其它图像；只保存弱引用，不会让使用方一直存活
+
+        参数:
+            method: 绑定方法
+        """
+        with self.__lock:
+            self.__watchers = [watcher for watcher in self.__watchers if watcher() is not None]
+            self.__watchers.append(weakref.WeakMethod(method))
+
+    def reload(self) -> None:
+        """
+        重新加载 unload 释放的资源，加载方式 (同步或后台) 与创建时相同
+        """
+        with self.__lock:
+            if not self.__unloaded:
+                return
+            self.__unloaded = False
+            self.__done.clear()
+        self.__start()
+
+    def nbytes(self) -> int:
+        """
+        返回:
+            int: 已加载的资源大约占用的内存 (字节)
+        """
+        return 0
+
+    def placeholder(self) -> Any:
+        """
+        后台加载完成前 res 返回的值
+        """
+        return None
+
+    def done(self) -> bool:
+        return self.__done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        等待加载完成
+
+        返回:
+            bool: 超时前是否加载完成
+        """
+        return self.__done.wait(timeout)
+
+    def result(self, timeout: float | None = None) -> Any:
+        """
+        等待加载完成并返回资源，加载失败时抛出加载时的异常
+        """
+        if not self.__done.wait(timeout):
+            raise TimeoutError(f"Resource {self.__path} is still loading")
+        if self.__unloaded:
+            raise RuntimeError(f"Resource {self.__path} has been unloaded")
+        if not self.__isLoad:
+            raise self.__errmsg
+        return self.__res
+
+    def add_done_callback(self, callback: Callable[["Resource"], None]) -> None:
+        """
+        加载完成后调用 callback(resource)，已经完成时立即调用；后台加载时在加载线程中执行
+        """
+        with self.__lock:
+            if not self.__done.is_set():
+                self.__callbacks.append(callback)
+                return
+        callback(self)
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    @property
+    def state(self) -> str:
+        if not self.__done.is_set():
+            return self.PENDING
+        if self.__unloaded:
+            return self.UNLOADED
+        return self.LOADED if self.__isLoad else self.FAILED
+
     @property
     def res(self) -> Any:
+        if not self.__done.is_set() or self.__unloaded:
+            return self.placeholder()
         return self.__res
 
     @property
@@ -0,0 +1,166 @@
+﻿import sys
+import threading
+import time
+from typing import Any, Callable
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+class _Record:
+    __slots__ = ("profiler", "name", "table")
+
+    def __init__(self, profiler: "StartupProfiler", name: str, table: dict[str, list[int]]) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.table = table
+
+    def __enter__(self) -> None:
+        self.profiler.begin(self.name, self.table)
+
+    def __exit__(self, *args) -> None:
+        self.profiler.end()
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _TimedLoader:
+    def __init__(self, profiler: "StartupProfiler", loader: Any) -> None:
+        self._profiler = profiler
+        self._loader = loader
+
+    def create_module(self, spec) -> Any:
+        # 扩展模块在 create_module 中执行初始化
+        with _Record(self._profiler, spec.name, self._profiler.modules):
+            return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        with _Record(self._profiler, module.__name__, self._profiler.modules):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class StartupProfiler:
+    def __init__(self) -> None:
+        """
+        统计启动时每个模块的导入耗时和各个初始化阶段的耗时
+
+        install() 之后导入的模块都会被计时；累计时间包含它导入的其它模块，自身时间不包含
+        未安装时 phase() 只返回一个共享的空上下文
+        """
+        self.installed = False
+        self.start = 0
+
+        # 名称 -> [累计时间, 自身时间] (纳秒)
+        self.modules: dict[str, list[int]] = {}
+        self.phases: dict[str, list[int]] = {}
+
+        self._stack: list[list] = []
+        self._thread = None
+
+    def find_spec(self, fullname: str, path, target=None) -> Any:
+        if threading.get_ident() != self._thread:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(self, spec.loader)
+                return spec
+        return None
+
+    def install(self) -> None:
+        if self.installed:
+            return
+        self.installed = True
+        self.start = time.perf_counter_ns()
+        self._thread = threading.get_ident()
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        self.installed = False
+
+    def begin(self, name: str, table: dict[str, list[int]]) -> None:
+        # 在开始时登记，报告中的阶段按开始顺序排列
+        table.setdefault(name, [0, 0])
+        self._stack.append([name, table, time.perf_counter_ns(), 0])
+
+    def end(self) -> None:
+        name, table, start, children = self._stack.pop()
+        total = time.perf_counter_ns() - start
+        if self._stack:
+            self._stack[-1][3] += total
+
+        record = table[name]
+        record[0] += total
+        record[1] += total - children
+
+    def phase(self, name: str) -> _Record | _NullPhase:
+        """
+        用 with 语句包住需要计时的初始化代码
+        """
+        if not self.installed:
+            return _NULL_PHASE
+        return _Record(self, name, self.phases)
+
+    def profile(self, factory: Callable[[], Any], frames: int = 1) -> Any:
+        """
+        创建应用并运行 frames 帧，然后输出报告
+
+        参数:
+            factory (Callable): 返回 Application 的函数
+            frames (int): 计入启动时间的帧数
+
+        返回:
+            Any: 创建的应用
+        """
+        self.install()
+        with self.phase("Application()"):
+            app = factory()
+        with self.phase("WindowManager.enter"):
+            app.window_manager.enter()
+        for _ in range(frames):
+            with self.phase("first frame"):
+                app.handle_events()
+                app.update()
+        self.uninstall()
+
+        print(self.report())
+        return app
+
+    def report(self, limit: int = 40) -> str:
+        elapsed = (time.perf_counter_ns() - self.start) / 1e6
+        lines = [f"startup: {elapsed:.1f} ms, {len(self.modules)} modules imported",
+                 "", f"{'cumulative':>12} {'self':>10}  module"]
+
+        modules = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (total, own) in modules[:limit]:
+            lines.append(f"{total / 1e6:>9.2f} ms {own / 1e6:>7.2f} ms  {name}")
+        if len(modules) > limit:
+            lines.append(f"{'':>23}  ... {len(modules) - limit} more")
+
+        lines += ["", f"{'cumulative':>12} {'self':>10}  phase"]
+        for name, (total, own) in self.phases.items():
+            lines.append(f"{total / 1e6:>9.2f} ms {own / 1e6:>7.2f} ms  {name}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"<StartupProfiler installed:{self.installed} modules:{len(self.modules)} phases:{len(self.phases)}>"
+
+
+Startup_ = StartupProfiler()
\ No newline at end of file
@@ -1,10 +1,19 @@
 ﻿from pygame import Surface, Rect
 
+from src.Libs.Utils.types import vec2, ColorType
 from src.Libs.Window.display import Display
+from src.Resources import Resource
+from src.Resources.Manager import ResourceManager_
 from src.Surface.Base import BaseSurface
+from src.Surface.compositor import Compositor_
+from src.Surface.pool import SurfacePool_
 
 
 class CustomizeSurface(BaseSurface):
+    BACKGROUND: ColorType = "Black"
+    # 为 True 时自身内容画在持久的 layer 上，只有 invalidate 之后或 layer_key 变化时才调用 paint 重新绘制
+    RETAINED: bool = False
+
     def __init__(self, base_size: tuple[int, int], size: tuple[int, int] | Surface, pos: tuple[int, int] = (0,0)) -> None:
         super().__init__()
         if isinstance(size, tuple):
@@ -25,6 +34,14 @@ class CustomizeSurface(BaseSurface):
 
         self.parent = None
 
+        self.layer: Surface | None = None
+        self.invalid = True
+        self._layer_key = None
+
+        # 在 enter 中 acquire、在 exit 中 release 的资源
+        self.resources: list[Resource] = []
+        self.entered = False
+
     @property
     def surface_display(self):
         return self.parent.surface_display
@@ -53,13 +70,106 @@ class CustomizeSurface(BaseSurface):
     def w_y(self):
         return self._y + getattr(self.parent, 'w_y', 0)
 
+    @property
+    def alpha(self) -> float:
+        """
+        固定步长模式下的插值系数，表示当前画面位于上一次和下一次 fixed_update 之间的位置
+        """
+        return getattr(self.parent, 'alpha', 1.0)
+
+    def use(self, *resources: Resource) -> None:
+        """
+        登记窗口使用的资源，窗口显示期间这些资源不会因为超出内存预算被释放
+        """
+        for resource in resources:
+            self.resources.append(resource)
+            if self.entered:
+                ResourceManager_.acquire(resource)
+
+    def enter(self) -> None:
+        if self.entered:
+            return
+        self.entered = True
+        for resource in self.resources:
+            ResourceManager_.acquire(resource)
+
+    def exit(self) -> None:
+        if not self.entered:
+            return
+        self.entered = False
+        for resource in self.resources:
+            ResourceManager_.release(resource)
+
+    def get_render_size(self) -> vec2:
+        return Display.get_global_size(self.width, self.height, size=(self.s_width, self.s_height))
+
+    def get_render_rect(self, size: tuple[int, int] | None = None) -> Rect:
+        """
+        参数:
+            size (tuple, optional): box 的尺寸，默认为当前 box 的尺寸
+        """
+        rect = Rect((0, 0), size if size is not None else self.box.get_size())
+        rect.topleft = Display.get_global_size(self.x, self.y, size=(self.s_width, self.s_height))
+        return rect
+
+    def layer_key(self) -> tuple:
+        """
+        返回值变化时保留层需要重新绘制，默认为 box 的尺寸
+        """
+        return self.box.get_size()
+
+    def invalidate(self) -> None:
+        """
+        标记保留层需要在下一次 render 时重新绘制
+        """
+        self.invalid = True
+        self.mark_dirty()
+
+    def paint(self, surface: Surface) -> None:
+        """
+        RETAINED 为 True 时在这里把自身内容画到 surface (layer) 上，背景色已经填充好
+        """
+
     def render(self) -> None:
-        self.box = Surface(Display.get_global_size(self.width, self.height, size=(self.s_width, self.s_height)))
-        self.box_rect = self.box.get_rect(topleft=Display.get_global_size(self.x, self.y, size=(self.s_width, self.s_height)))
+        self.box = SurfacePool_.resize(self.box, self.get_render_size())
+        if not self.RETAINED:
+            # 每帧都重新绘制，无法知道哪里变化了，整个 box 都是脏区
+            self.box.fill(self.BACKGROUND)
+            self.box_rect = self.get_render_rect()
+            self.mark_dirty()
+            return
+
+        self.box_rect = self.get_render_rect()
+        key = self.layer_key()
+        if key != self._layer_key:
+            self._layer_key = key
+            self.layer = SurfacePool_.resize(self.layer, self.box.get_size())
+            self.invalid = True
+
+        if self.invalid:
+            self.invalid = False
+            self.layer.fill(self.BACKGROUND)
+            self.paint(self.layer)
+            Compositor_.repainted(self)
+            # layer_key 变化 (例如后台加载的图标完成) 引起的重绘不经过 invalidate，也要报告
+            self.mark_dirty()
+
+        self.box.blit(self.layer, (0, 0))
 
     def get_center_box(self) -> Rect:
         return Display.get_global_rect(self.parent.get_center_box(), self.box_rect)
 
+    def mark_dirty(self, rect: Rect | None = None) -> None:
+        """
+        向上报告发生变化的区域
+
+        参数:
+            rect (Rect, optional): 相对于自身 box 的区域，默认为整个 box
+        """
+        rect = Rect(self.box_rect) if rect is None else rect.move(self.box_rect.topleft)
+        if self.parent is not None:
+            self.parent.mark_dirty(rect)
+
     def afterRender(self) -> None:
         surface = getattr(self.parent, "box", self.surface_display)
         surface.blit(self.box, self.box_rect)
\ No newline at end of file
@@ -5,6 +5,7 @@ class BaseSurface:
     def enter(self) -> None: ...
     def exit(self) -> None: ...
     def update(self) -> None: ...
+    def fixed_update(self, dt: float) -> None: ...
     def handle_event(self, event: InputAction) -> None: ...
     def beforeRender(self) -> None: ...
     def render(self) -> None: ...
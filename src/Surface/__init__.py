@@ -1,11 +1,94 @@
-﻿from pygame import Surface
+﻿from typing import Callable
+
+from pygame import SRCALPHA, Surface
 from pygame.transform import scale
 from src.Libs.Window.display import Display
+from src.Resources import Resource
+from src.Surface.cache import SurfaceCache
+from src.Surface.derived import DerivedCache, DerivedCache_
 
 
 class SurfaceRender:
-    def __init__(self, surface: Surface):
-        self._surface = surface
+    cache = SurfaceCache()
+    derived = DerivedCache_
+    # 为 False 时 _derive 足够便宜 (例如纯色填充)，直接生成，不读写磁盘缓存
+    DERIVED_CACHE = True
+
+    def __init__(self, surface: Surface | Resource, transform: Callable[[Surface], Surface] | None = None):
+        """
+        参数:
+            surface (Surface | Resource): 源图像，传入还在后台加载的资源时，加载完成前渲染为透明图像
+            transform (Callable, optional): 资源加载完成后对源图像做的处理 (例如混合颜色)
+        """
+        self._source = surface
+        self._transform = transform
+        self._surface = None
+        self._source_key = None
+        # 生成 _surface 时资源的 version，资源重新加载后需要重新生成
+        self._version = None
+        # 每次重新生成 _surface 时递增
+        self.generation = 0
+
+        if isinstance(surface, Resource):
+            surface.watch(self._release)
+        else:
+            self._resolve()
+
+    def _release(self, resource: Resource | None = None) -> None:
+        """
+        资源被释放时丢掉由它生成的图像和缓存，让内存真正被回收
+        """
+        self._surface = None
+        self._source_key = None
+        self._version = None
+        self.cache.discard(self)
+
+    def _resolve(self) -> Surface | None:
+        source = self._source
+        if isinstance(source, Resource):
+            # 加载中、加载失败或已释放时 res 不是真正的图像，不能交给 transform，渲染为占位图
+            if source.state != Resource.LOADED:
+                if self._surface is not None:
+                    self._release()
+                return None
+            if source.version != self._version:
+                self._release()
+                self._version = source.version
+
+        if self._surface is None:
+            if isinstance(source, Resource):
+                source = source.res
+            self._surface = self._transform(source) if self._transform else source
+            self.generation += 1
+        return self._surface
+
+    @property
+    def ready(self) -> bool:
+        """源图像是否已经可用"""
+        return self._resolve() is not None
+
+    def source_key(self) -> str:
+        if self._source_key is None:
+            self._source_key = DerivedCache.surface_key(self._surface)
+        return self._source_key
+
+    def _derive(self, size: tuple[int, int]) -> Surface:
+        return scale(self._surface, size)
+
+    @staticmethod
+    def _placeholder(size: tuple[int, int]) -> Surface:
+        return Surface(size, SRCALPHA)
+
+    def _build(self, size: tuple[int, int]) -> Surface:
+        if not self.DERIVED_CACHE:
+            return self._derive(size).convert_alpha()
+        key = DerivedCache.key(type(self).__name__, self.source_key(), size)
+        return self.derived.get(key, self._derive, size).convert_alpha()
 
     def render(self, w: int, h: int) -> Surface:
-        return scale(self._surface, Display.get_global_size(w, h)).convert_alpha()
\ No newline at end of file
+        width, height = Display.get_global_size(w, h)
+        size = int(width), int(height)
+        if self._resolve() is None:
+            # 同尺寸的占位图由所有未加载完成的 SurfaceRender 共用
+            return self.cache.get((SurfaceRender, size), self._placeholder, size)
+        return self.cache.get((self, size), self._build, size)
\ No newline at end of file
@@ -0,0 +1,258 @@
+﻿import json
+from pathlib import Path
+from typing import Iterable
+
+import pygame
+from pygame import Rect, Surface
+
+from src.Libs.Window.display import Display
+from src.Surface import SurfaceRender
+from src.Surface.cache import SurfaceCache
+
+
+class TextureAtlas:
+    def __init__(self, width: int = 256, height: int = 256, padding: int = 1) -> None:
+        """
+        把多张小贴图打包进一张 Surface 的图集，用 skyline 算法寻找位置，空间不足时高度翻倍
+
+        sprite() 返回的是图集的 subsurface，不复制像素；draw() 用一次 Surface.blits 画出多个贴图
+
+        参数:
+            width (int): 图集宽度
+            height (int): 图集的初始高度
+            padding (int): 贴图之间的间隔 (像素)
+        """
+        self.padding = padding
+        self.atlas = self._new_surface((width, height))
+
+        # skyline 的每一段为 [x, y, 宽度]，按 x 排列
+        self._skyline: list[list[int]] = [[0, 0, width]]
+        self._rects: dict[str, Rect] = {}
+        self._sprites: dict[str, Surface] = {}
+
+    @staticmethod
+    def _new_surface(size: tuple[int, int]) -> Surface:
+        surface = Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            # 转换成显示格式，绘制时不需要再转换像素
+            surface = surface.convert_alpha()
+            surface.fill((0, 0, 0, 0))
+        return surface
+
+    @classmethod
+    def build(cls, surfaces: dict[str, Surface], width: int = 256, padding: int = 1) -> "TextureAtlas":
+        """
+        一次打包多张贴图，先放高的贴图，打包结果更紧凑
+
+        参数:
+            surfaces (dict): 名称 -> 贴图
+            width (int): 图集的最小宽度，比最宽的贴图窄时使用最宽贴图的宽度
+        """
+        widest = max((surface.get_width() + padding for surface in surfaces.values()), default=0)
+        atlas = cls(max(width, widest), width, padding)
+        for name, surface in sorted(surfaces.items(), key=lambda item: (-item[1].get_height(), -item[1].get_width())):
+            atlas.add(name, surface)
+        return atlas
+
+    def _grow(self, height: int) -> None:
+        atlas = self._new_surface((self.atlas.get_width(), height))
+        atlas.blit(self.atlas, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self.atlas = atlas
+        # 旧的 subsurface 仍然指向旧图集，之后重新生成
+        self._sprites.clear()
+
+    def _find(self, width: int, height: int) -> tuple[int, int, int] | None:
+        """
+        返回:
+            tuple | None: 放置后顶部最低的位置 (skyline 段序号, x, y)，宽度放不下时为 None
+        """
+        best = None
+        skyline = self._skyline
+        for i, (x, _, _) in enumerate(skyline):
+            if x + width > self.atlas.get_width():
+                break
+
+            y = 0
+            remaining = width
+            j = i
+            while remaining > 0:
+                y = max(y, skyline[j][1])
+                remaining -= skyline[j][2]
+                j += 1
+
+            if best is None or y < best[2]:
+                best = i, x, y
+        return best
+
+    def _place(self, width: int, height: int) -> Rect:
+        if width > self.atlas.get_width():
+            raise ValueError(f"Texture width {width} exceeds atlas width {self.atlas.get_width()}")
+
+        index, x, y = self._find(width, height)
+        while y + height > self.atlas.get_height():
+            self._grow(self.atlas.get_height() * 2)
+
+        # 新的一段覆盖 [x, x + width)，截断或删除被覆盖的旧段
+        skyline = self._skyline
+        skyline.insert(index, [x, y + height, width])
+        i = index + 1
+        while i < len(skyline):
+            segment = skyline[i]
+            overlap = x + width - segment[0]
+            if overlap <= 0:
+                break
+            if overlap < segment[2]:
+                segment[0] += overlap
+                segment[2] -= overlap
+                break
+            del skyline[i]
+
+        # 合并高度相同的相邻段
+        i = 0
+        while i < len(skyline) - 1:
+            if skyline[i][1] == skyline[i + 1][1]:
+                skyline[i][2] += skyline.pop(i + 1)[2]
+            else:
+                i += 1
+
+        return Rect(x, y, width, height)
+
+    def add(self, name: str, surface: Surface) -> Rect:
+        """
+        把贴图复制进图集，已存在同名贴图时直接返回它的位置
+
+        返回:
+            Rect: 贴图在图集中的区域
+        """
+        rect = self._rects.get(name)
+        if rect is not None:
+            return rect
+
+        width, height = surface.get_size()
+        slot = self._place(width + self.padding, height + self.padding)
+        rect = self._rects[name] = Rect(slot.topleft, (width, height))
+        # 图集原本是全透明的，BLEND_RGBA_MAX 等同于原样复制像素 (包括透明度)
+        self.atlas.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return rect
+
+    def rect(self, name: str) -> Rect:
+        return self._rects[name]
+
+    def sprite(self, name: str) -> Surface:
+        """
+        返回:
+            Surface: 贴图所在区域的 subsurface，与图集共用像素
+        """
+        sprite = self._sprites.get(name)
+        if sprite is None:
+            sprite = self._sprites[name] = self.atlas.subsurface(self._rects[name])
+        return sprite
+
+    def sequence(self, items: Iterable[tuple[str, tuple[int, int]]]) -> list[tuple[Surface, tuple[int, int], Rect]]:
+        """
+        返回:
+            list: 可以直接传给 Surface.blits 的 (图集, 位置, 区域)
+        """
+        atlas = self.atlas
+        rects = self._rects
+        return [(atlas, pos, rects[name]) for name, pos in items]
+
+    def draw(self, surface: Surface, items: Iterable[tuple[str, tuple[int, int]]]) -> None:
+        """
+        用一次 Surface.blits 画出多个贴图
+
+        参数:
+            items (Iterable): (名称, 位置)
+        """
+        surface.blits(self.sequence(items), doreturn=False)
+
+    def save(self, path: str | Path) -> Path:
+        """
+        把图集保存为 PNG，贴图位置保存在同名的 .json 文件中，之后可以用 load 直接读取，不需要重新打包
+
+        返回:
+            Path: PNG 文件路径
+        """
+        path = Path(path)
+        pygame.image.save(self.atlas, path)
+        index = {
+            "padding": self.padding,
+            "skyline": self._skyline,
+            "rects": {name: list(rect) for name, rect in self._rects.items()},
+        }
+        with open(path.with_suffix(".json"), "w", encoding="utf-8") as file:
+            json.dump(index, file)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "TextureAtlas":
+        path = Path(path)
+        with open(path.with_suffix(".json"), encoding="utf-8") as file:
+            index = json.load(file)
+
+        image = pygame.image.load(path)
+        atlas = cls(image.get_width(), image.get_height(), index["padding"])
+        atlas.atlas.blit(image, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        atlas._skyline = index["skyline"]
+        atlas._rects = {name: Rect(rect) for name, rect in index["rects"].items()}
+        return atlas
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rects
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __repr__(self) -> str:
+        return f"<TextureAtlas textures:{len(self)} atlas:{self.atlas.get_size()}>"
+
+
+class SurfaceAtlas:
+    def __init__(self, renders: dict[str, SurfaceRender], padding: int = 1) -> None:
+        """
+        把几个总是以相同尺寸绘制的 SurfaceRender 缩放后打包进一张图集，尺寸或显示格式变化时重新打包
+
+        参数:
+            renders (dict): 名称 -> SurfaceRender
+            padding (int): 贴图之间的间隔 (像素)
+        """
+        self.renders = renders
+        self.padding = padding
+        self.builds = 0
+
+        self._atlas: TextureAtlas | None = None
+        self._key = None
+
+    @property
+    def ready(self) -> bool:
+        """所有源图像是否都已经可用"""
+        return all(render.ready for render in self.renders.values())
+
+    def atlas(self, w: int, h: int) -> TextureAtlas | None:
+        """
+        返回:
+            TextureAtlas | None: 以 (w, h) 绘制时使用的图集，有源图像还在加载时为 None
+        """
+        width, height = Display.get_global_size(w, h)
+        if not self.ready:
+            return None
+        # 源图像重新生成 (例如资源被释放后重新加载) 时也需要重新打包
+        key = (int(width), int(height)), SurfaceCache.display_mode(), tuple(render.generation for render in self.renders.values())
+        if key != self._key:
+            self._atlas = TextureAtlas.build({name: render.render(w, h) for name, render in self.renders.items()},
+                                             padding=self.padding)
+            self._key = key
+            self.builds += 1
+        return self._atlas
+
+    def render(self, name: str, w: int, h: int) -> Surface:
+        """
+        与 SurfaceRender.render 相同，返回的是图集的 subsurface
+        """
+        atlas = self.atlas(w, h)
+        if atlas is None:
+            return self.renders[name].render(w, h)
+        return atlas.sprite(name)
+
+    def __repr__(self) -> str:
+        return f"<SurfaceAtlas renders:{list(self.renders)} builds:{self.builds} atlas:{self._atlas}>"
\ No newline at end of file
@@ -0,0 +1,123 @@
+﻿from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import pygame
+from pygame import Surface
+
+
+class SurfaceCache:
+    def __init__(self, budget: int = 32 * 1024 * 1024, display_bound: bool = True) -> None:
+        """
+        按字节预算限制的 LRU Surface 缓存
+
+        参数:
+            budget (int): 缓存可占用的最大字节数
+            display_bound (bool): 缓存内容依赖显示格式时为 True，显示模式变化时自动清空
+        """
+        self.budget = budget
+        self.display_bound = display_bound
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.frame_hits = 0
+        self.frame_misses = 0
+        self._frame_start = 0, 0
+
+        self._entries: OrderedDict[Hashable, Surface] = OrderedDict()
+        self._bytes = 0
+        self._display_mode = None
+
+    @staticmethod
+    def size_of(surface: Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def display_mode() -> Any:
+        surface = pygame.display.get_surface()
+        if surface is None:
+            return None
+        return surface.get_size(), surface.get_bitsize(), surface.get_flags()
+
+    def get(self, key: Hashable, build: Callable[..., Surface], *args) -> Surface:
+        """
+        取出缓存的 Surface，未命中时调用 build(*args) 生成并缓存
+
+        返回的 Surface 会被多处共享，调用方不应修改它
+        """
+        if self.display_bound:
+            mode = self.display_mode()
+            if mode != self._display_mode:
+                self.clear()
+                self._display_mode = mode
+
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build(*args)
+        self.put(key, surface)
+        return surface
+
+    def put(self, key: Hashable, surface: Surface) -> None:
+        size = self.size_of(surface)
+        if size > self.budget:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= self.size_of(old)
+
+        self._entries[key] = surface
+        self._bytes += size
+        self.trim()
+
+    def trim(self) -> None:
+        while self._bytes > self.budget and self._entries:
+            _, surface = self._entries.popitem(last=False)
+            self._bytes -= self.size_of(surface)
+            self.evictions += 1
+
+    def discard(self, owner: Any) -> None:
+        """
+        移除所有键为 (owner, ...) 的条目
+        """
+        for key in [key for key in self._entries if isinstance(key, tuple) and key and key[0] is owner]:
+            self._bytes -= self.size_of(self._entries.pop(key))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def end_frame(self) -> None:
+        """
+        结束一帧，记录这一帧内的命中与未命中次数
+        """
+        hits, misses = self._frame_start
+        self.frame_hits = self.hits - hits
+        self.frame_misses = self.misses - misses
+        self._frame_start = self.hits, self.misses
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.frame_hits = 0
+        self.frame_misses = 0
+        self._frame_start = 0, 0
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (f"<SurfaceCache entries:{len(self)} bytes:{self._bytes}/{self.budget} "
+                f"hits:{self.hits} misses:{self.misses} evictions:{self.evictions} "
+                f"frame:{self.frame_hits}/{self.frame_hits + self.frame_misses}>")
\ No newline at end of file
@@ -1,16 +1,29 @@
-﻿from pygame import Surface
+﻿import pygame
+from pygame import Surface
 
 from src.Libs.Utils.types import ColorType
-from src.Surface import SurfaceRender
+from src.Surface import SurfaceRender, DerivedCache
 
 
 class SurfaceColor(SurfaceRender):
+    DERIVED_CACHE = False
+
     def __init__(self, color: ColorType):
         self._color = color
         surface = Surface((64, 64))
         surface.fill(self._color)
         super().__init__(surface)
 
+    def source_key(self) -> str:
+        if self._source_key is None:
+            self._source_key = DerivedCache.key(tuple(pygame.Color(self._color)))
+        return self._source_key
+
+    def _derive(self, size: tuple[int, int]) -> Surface:
+        surface = Surface(size)
+        surface.fill(self._color)
+        return surface
+
     @property
     def color(self) -> ColorType:
         return self._color
\ No newline at end of file
@@ -0,0 +1,58 @@
+﻿import pygame
+from pygame import Rect, Surface
+
+from src.Libs.Utils.types import ColorType
+
+
+class Compositor:
+    def __init__(self, color: ColorType = "Magenta", width: int = 2) -> None:
+        """
+        统计每帧重新绘制了哪些保留层，debug 为 True 时在屏幕上用边框标出这些层
+
+        参数:
+            color (ColorType): 调试边框颜色
+            width (int): 调试边框宽度
+        """
+        self.debug = False
+        self.color = color
+        self.width = width
+
+        self.repaints = 0
+        self.frame_repaints = 0
+        self.total_repaints = 0
+
+        self._layers = []
+
+    def repainted(self, layer) -> None:
+        """
+        由 CustomizeSurface 在重新绘制保留层后调用
+        """
+        self.repaints += 1
+        self.total_repaints += 1
+        if self.debug:
+            self._layers.append(layer)
+
+    def draw_overlay(self, surface: Surface) -> list[Rect]:
+        """
+        在 surface 上画出本帧重新绘制的层
+
+        返回:
+            list[Rect]: 画过边框的区域，脏矩形模式下需要一起提交
+        """
+        rects = []
+        for layer in self._layers:
+            rect = Rect(layer.get_center_box().topleft, layer.box.get_size())
+            pygame.draw.rect(surface, self.color, rect, self.width)
+            rects.append(rect)
+        return rects
+
+    def end_frame(self) -> None:
+        self.frame_repaints = self.repaints
+        self.repaints = 0
+        self._layers.clear()
+
+    def __repr__(self) -> str:
+        return f"<Compositor debug:{self.debug} frame:{self.frame_repaints} total:{self.total_repaints}>"
+
+
+Compositor_ = Compositor()
\ No newline at end of file
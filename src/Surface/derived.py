@@ -0,0 +1,240 @@
+﻿import hashlib
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import pygame
+from pygame import Surface
+
+from src.Libs.File.path import MPath
+from src.Resources.Baked import Baked_
+from src.Resources.Loader import Loader_
+
+
+class DerivedCache:
+    # 修改任何派生贴图的生成算法后递增，旧的缓存文件会因为键不同而失效
+    VERSION = 1
+
+    MAGIC = b"SAXD"
+    HEADER = struct.Struct("<4sIIB")
+    SUFFIX = ".raw"
+
+    def __init__(self, path: str | Path | None = None, limit: int = 64 * 1024 * 1024, enabled: bool = True) -> None:
+        """
+        以内容哈希为键、保存在磁盘上的派生贴图缓存（着色、缩放、纯色等）
+
+        文件内容是原始像素数据，读取时直接复制成 Surface，不需要解码
+
+        参数:
+            path (str | Path | None): 缓存目录，默认为 MPath.cache_dir() / "derived"
+            limit (int): 缓存目录可占用的最大字节数，超出时按最近使用时间删除
+            enabled (bool): 为 False 时总是直接生成，不读写磁盘
+        """
+        self._path = Path(path) if path is not None else None
+        self.limit = limit
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # 文件名 -> (字节数, 最近使用时间)，第一次写入时才扫描目录
+        self._index: dict[str, tuple[int, float]] | None = None
+        # 写入在加载线程中进行，索引会被多个线程修改
+        self._lock = threading.RLock()
+        # 正在后台写入的键
+        self._pending: set[str] = set()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = MPath.cache_dir() / "derived"
+        return self._path
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        把各部分拼成缓存键，bytes 原样参与哈希，其它值使用 repr
+
+        返回:
+            str: 十六进制摘要
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(str(DerivedCache.VERSION).encode())
+        for part in parts:
+            data = part if isinstance(part, bytes) else repr(part).encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def surface_key(surface: Surface) -> str:
+        """
+        根据 Surface 的尺寸、是否带透明通道和像素内容计算摘要，来自贴图包的 Surface 直接使用烘焙时记录的摘要
+        """
+        key = Baked_.source_key(surface)
+        if key is not None:
+            return key
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        return DerivedCache.key(surface.get_size(), alpha, pygame.image.tobytes(surface, "RGBA" if alpha else "RGB"))
+
+    def get(self, key: str, build: Callable[..., Surface], *args) -> Surface:
+        """
+        依次从贴图包和磁盘读取派生贴图，都未命中时调用 build(*args) 生成，并在后台写入磁盘
+        """
+        surface = Baked_.derived(key) if self.enabled else None
+        if surface is None:
+            surface = self.load(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build(*args)
+        self.store(key, surface, background=True)
+        return surface
+
+    def _file(self, key: str) -> Path:
+        return self.path / (key + self.SUFFIX)
+
+    def load(self, key: str) -> Surface | None:
+        if not self.enabled:
+            return None
+
+        file = self._file(key)
+        try:
+            with open(file, "rb") as stream:
+                data = stream.read()
+            os.utime(file)
+        except OSError:
+            return None
+
+        if len(data) < self.HEADER.size:
+            return None
+        magic, width, height, alpha = self.HEADER.unpack_from(data)
+        fmt = "RGBA" if alpha else "RGB"
+        pixels = memoryview(data)[self.HEADER.size:]
+        if magic != self.MAGIC or len(pixels) != width * height * len(fmt):
+            return None
+
+        with self._lock:
+            if self._index is not None:
+                self._index[file.name] = len(data), os.path.getmtime(file)
+        # frombuffer 生成的 Surface 指向不可变的 bytes，写入会改到它，交出去的是副本
+        return pygame.image.frombuffer(pixels, (width, height), fmt).copy()
+
+    def store(self, key: str, surface: Surface, background: bool = False) -> None:
+        """
+        参数:
+            background (bool): 是否在加载线程中写入磁盘，像素在调用时就已复制，之后修改 surface 不影响写入的内容
+        """
+        if not self.enabled:
+            return
+
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        pixels = pygame.image.tobytes(surface, "RGBA" if alpha else "RGB")
+        if self.HEADER.size + len(pixels) > self.limit:
+            return
+
+        header = self.HEADER.pack(self.MAGIC, surface.get_width(), surface.get_height(), alpha)
+        if not background:
+            self._write(key, header, pixels)
+            return
+
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        Loader_.submit(self._write, key, header, pixels)
+
+    def _write(self, key: str, header: bytes, pixels: bytes) -> None:
+        try:
+            self._write_file(key, header, pixels)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _write_file(self, key: str, header: bytes, pixels: bytes) -> None:
+        file = self._file(key)
+        temp = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(temp, "wb") as stream:
+                stream.write(header)
+                stream.write(pixels)
+            # 先写临时文件再替换，避免其它进程读到写了一半的文件
+            os.replace(temp, file)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._scan()[file.name] = len(header) + len(pixels), os.path.getmtime(file)
+            self.trim()
+
+    def _scan(self) -> dict[str, tuple[int, float]]:
+        with self._lock:
+            if self._index is None:
+                self._index = {}
+                try:
+                    with os.scandir(self.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                                stat = entry.stat()
+                                self._index[entry.name] = stat.st_size, stat.st_mtime
+                except OSError:
+                    pass
+            return self._index
+
+    def trim(self) -> None:
+        """
+        缓存目录超出 limit 时按最近使用时间从旧到新删除
+        """
+        with self._lock:
+            index = self._scan()
+            total = self.bytes
+            if total <= self.limit:
+                return
+
+            for name, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+                try:
+                    os.remove(self.path / name)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                del index[name]
+                total -= size
+                self.evictions += 1
+                if total <= self.limit:
+                    break
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._scan()):
+                try:
+                    os.remove(self.path / name)
+                except OSError:
+                    pass
+            self._index = {}
+
+    @property
+    def bytes(self) -> int:
+        with self._lock:
+            return sum(size for size, _ in self._scan().values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._scan())
+
+    def __repr__(self) -> str:
+        return (f"<DerivedCache path:{self.path} entries:{len(self)} bytes:{self.bytes}/{self.limit} "
+                f"hits:{self.hits} misses:{self.misses} evictions:{self.evictions}>")
+
+
+DerivedCache_ = DerivedCache()
\ No newline at end of file
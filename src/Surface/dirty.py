@@ -0,0 +1,119 @@
+﻿from collections import deque
+
+from pygame import Rect, Surface
+
+from src.Libs.Utils.types import ColorType
+
+
+class DirtyStats:
+    def __init__(self) -> None:
+        self.rects = 0
+        self.area = 0
+        self.screen_area = 0
+        self.full = False
+
+    @property
+    def ratio(self) -> float:
+        """重绘面积占整个屏幕的比例 (0.0-1.0)"""
+        if not self.screen_area:
+            return 0.0
+        return self.area / self.screen_area
+
+    def __repr__(self) -> str:
+        return f"<DirtyStats rects:{self.rects} area:{self.area}/{self.screen_area} ({self.ratio:.1%}) full:{self.full}>"
+
+
+class DirtyRegion:
+    def __init__(self, full_ratio: float = 0.75, history: int = 2) -> None:
+        """
+        记录每帧发生变化的屏幕区域
+
+        窗口的 box 在下一帧的 afterRender 中才会被贴到上一层，每多一层嵌套变化就晚一帧到达屏幕，
+        所以之前 history 帧的脏区也要一起提交
+
+        参数:
+            full_ratio (float): 合并后的脏区面积超过屏幕面积的该比例时，直接整屏刷新
+            history (int): 一起提交的之前帧数，等于窗口嵌套的层数 (独立窗口 -> 子窗口为 2)
+        """
+        self.full_ratio = full_ratio
+        self.stats = DirtyStats()
+
+        self._rects: list[Rect] = []
+        self._full = True
+
+        # 之前 history 帧的 (脏区, 是否整屏)，刚创建时视为整屏
+        self._history: deque[tuple[list[Rect], bool]] = deque([([], True)] * history, maxlen=history)
+
+    def add(self, rect: Rect | None = None) -> None:
+        if rect is None:
+            self._full = True
+        elif rect.width > 0 and rect.height > 0:
+            self._rects.append(Rect(rect))
+
+    def invalidate(self) -> None:
+        self._full = True
+
+    @property
+    def full(self) -> bool:
+        return self._full or any(full for _, full in self._history)
+
+    @property
+    def rects(self) -> list[Rect]:
+        rects = list(self._rects)
+        for previous, _ in self._history:
+            rects += previous
+        return rects
+
+    def clear(self, surface: Surface, color: ColorType) -> None:
+        if self.full:
+            surface.fill(color)
+            return
+
+        for rect in self.rects:
+            surface.fill(color, rect)
+
+    def merge(self, bounds: Rect) -> list[Rect]:
+        """
+        合并本帧与之前 history 帧的脏区，并开始记录下一帧
+
+        返回:
+            list[Rect]: 互不重叠、已裁剪到 bounds 内的矩形列表
+        """
+        screen_area = bounds.width * bounds.height
+        full = self.full
+        rects = []
+
+        if not full:
+            rects = self.union([rect.clip(bounds) for rect in self.rects])
+            if sum(rect.width * rect.height for rect in rects) >= screen_area * self.full_ratio:
+                full = True
+
+        if full:
+            rects = [Rect(bounds)]
+
+        self.stats.rects = len(rects)
+        self.stats.area = sum(rect.width * rect.height for rect in rects)
+        self.stats.screen_area = screen_area
+        self.stats.full = full
+
+        if self._history.maxlen:
+            self._history.append((self._rects, self._full))
+        self._rects, self._full = [], False
+
+        return rects
+
+    @staticmethod
+    def union(rects: list[Rect]) -> list[Rect]:
+        merged: list[Rect] = []
+        for rect in rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            rect = Rect(rect)
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        return merged
\ No newline at end of file
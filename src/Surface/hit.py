@@ -0,0 +1,53 @@
+﻿from typing import Any
+
+from pygame import Rect
+
+
+class HitGrid:
+    def __init__(self, cell: int = 128) -> None:
+        """
+        按固定大小的格子索引矩形的点击测试结构，查询时只检查鼠标所在格子里的矩形
+
+        参数:
+            cell (int): 格子的边长 (像素)
+        """
+        self.cell = cell
+        self.rebuilds = 0
+
+        # 每个格子里的 (对象, 矩形) 按从上到下的层级排列
+        self._cells: dict[tuple[int, int], list[tuple[Any, Rect]]] = {}
+
+    def rebuild(self, items: list[tuple[Any, Rect]]) -> None:
+        """
+        参数:
+            items (list): 按从下到上的层级排列的 (对象, 矩形)
+        """
+        cell = self.cell
+        cells = {}
+        for obj, rect in reversed(items):
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            rect = Rect(rect)
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    cells.setdefault((cx, cy), []).append((obj, rect))
+
+        self._cells = cells
+        self.rebuilds += 1
+
+    def hit(self, pos: tuple[int, int]) -> Any:
+        """
+        返回:
+            Any: 包含 pos 的最上层对象，没有时为 None
+        """
+        x, y = int(pos[0]), int(pos[1])
+        for obj, rect in self._cells.get((x // self.cell, y // self.cell), ()):
+            if rect.collidepoint(x, y):
+                return obj
+        return None
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __repr__(self) -> str:
+        return f"<HitGrid cells:{len(self)} cell:{self.cell} rebuilds:{self.rebuilds}>"
\ No newline at end of file
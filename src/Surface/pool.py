@@ -0,0 +1,77 @@
+﻿import weakref
+
+from pygame import Surface, SRCALPHA
+
+
+class SurfacePool:
+    def __init__(self, max_free: int = 8) -> None:
+        """
+        按 (尺寸, flags, depth) 复用 Surface，减少每帧的内存分配
+
+        参数:
+            max_free (int): 每种规格最多保留的空闲 Surface 数量
+        """
+        self.max_free = max_free
+        self.hits = 0
+        self.misses = 0
+
+        self._free: dict[tuple, list[Surface]] = {}
+        # 由 acquire 取出的 Surface -> 规格，只保存弱引用，Surface 被丢弃后条目自动移除
+        self._keys: weakref.WeakKeyDictionary[Surface, tuple] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def key(size, flags: int = 0, depth: int = 0) -> tuple:
+        return (int(size[0]), int(size[1])), flags, depth
+
+    def acquire(self, size, flags: int = 0, depth: int = 0) -> Surface:
+        """
+        取出一个 Surface，内容不保证被清空
+        """
+        key = self.key(size, flags, depth)
+        free = self._free.get(key)
+        if free:
+            self.hits += 1
+            surface = free.pop()
+        else:
+            self.misses += 1
+            surface = Surface(key[0], flags, depth) if depth else Surface(key[0], flags)
+
+        self._keys[surface] = key
+        return surface
+
+    def release(self, surface: Surface | None) -> None:
+        if surface is None:
+            return
+
+        key = self._keys.pop(surface, None)
+        if key is None:
+            key = self.key(surface.get_size(), surface.get_flags() & SRCALPHA)
+
+        free = self._free.setdefault(key, [])
+        if len(free) < self.max_free and surface not in free:
+            free.append(surface)
+
+    def resize(self, surface: Surface | None, size, flags: int = 0, depth: int = 0) -> Surface:
+        """
+        尺寸与规格未变化时直接返回原 Surface，否则归还它并取出新的
+        """
+        key = self.key(size, flags, depth)
+        if surface is not None and self._keys.get(surface) == key:
+            self.hits += 1
+            return surface
+
+        self.release(surface)
+        return self.acquire(size, flags, depth)
+
+    def clear(self) -> None:
+        self._free.clear()
+
+    @property
+    def free(self) -> int:
+        return sum(len(v) for v in self._free.values())
+
+    def __repr__(self) -> str:
+        return f"<SurfacePool hits:{self.hits} misses:{self.misses} free:{self.free}>"
+
+
+SurfacePool_ = SurfacePool()
\ No newline at end of file
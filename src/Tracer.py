@@ -0,0 +1,155 @@
+﻿import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "owner", "start")
+
+    def __init__(self, tracer: "FrameTracer", name: str, owner: Any) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.owner = owner
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *args) -> None:
+        self.tracer.record(self.name, self.start, time.perf_counter_ns(), self.owner)
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class FrameTracer:
+    def __init__(self, capacity: int = 65536) -> None:
+        """
+        按阶段记录每帧耗时的追踪器，样本存放在固定大小的环形缓冲区中，可导出为 chrome://tracing / Perfetto 的 JSON
+
+        关闭时 span() 只返回一个共享的空上下文，不读取时钟也不分配对象
+
+        参数:
+            capacity (int): 环形缓冲区最多保存的样本数量，写满后覆盖最旧的样本
+        """
+        self.capacity = capacity
+        self.enabled = False
+
+        self.frame_count = 0
+        self._frame_start = 0
+
+        self._events: list[tuple | None] = [None] * capacity
+        self._index = 0
+        self._size = 0
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._frame_start = time.perf_counter_ns()
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str, owner: Any = None) -> _Span | _NullSpan:
+        """
+        用 with 语句包住需要计时的代码
+
+        参数:
+            name (str): 阶段名称
+            owner (Any): 所属的窗口，导出时显示为 "标题.阶段名称"，只在开启时才会取标题
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, owner)
+
+    def record(self, name: str, start: int, end: int, owner: Any = None) -> None:
+        """
+        直接记录一个样本
+
+        参数:
+            start (int): 开始时间 (time.perf_counter_ns)
+            end (int): 结束时间 (time.perf_counter_ns)
+        """
+        if owner is not None:
+            name = f"{getattr(owner, 'title', type(owner).__name__)}.{name}"
+
+        self._events[self._index] = name, start, end, self.frame_count, threading.get_ident()
+        self._index = (self._index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def frame(self) -> None:
+        """
+        结束一帧，记录从上一次调用到现在的整帧样本
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter_ns()
+        self.record("Frame", self._frame_start, now)
+        self._frame_start = now
+        self.frame_count += 1
+
+    def events(self) -> list[tuple[str, int, int, int, int]]:
+        """
+        返回:
+            list: 按记录顺序排列的 (名称, 开始, 结束, 帧号, 线程) 样本
+        """
+        start = (self._index - self._size) % self.capacity
+        return [self._events[(start + i) % self.capacity] for i in range(self._size)]
+
+    def to_chrome(self) -> dict:
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": "frame",
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"frame": frame},
+                }
+                for name, start, end, frame, tid in self.events()
+            ],
+        }
+
+    def export(self, path: str | Path) -> Path:
+        """
+        把缓冲区中的样本写成 chrome://tracing / Perfetto 可以打开的 JSON 文件
+
+        返回:
+            Path: 写入的文件路径
+        """
+        path = Path(path)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome(), file)
+        return path
+
+    def clear(self) -> None:
+        self._events = [None] * self.capacity
+        self._index = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"<FrameTracer enabled:{self.enabled} events:{self._size}/{self.capacity} frames:{self.frame_count}>"
+
+
+Tracer_ = FrameTracer()
\ No newline at end of file
@@ -1,19 +1,31 @@
-﻿from pygame import Surface
+﻿import pygame
+from pygame import Surface, Rect
 
 from src.Data.Fonts import msyh_font
+from src.Data.Resources.texture import close_resources, max_resources
 from src.Data.Surface import black_surface
-from src.Data.Surface.texture import red_close_surface, red_max_surface
+from src.Data.Surface.texture import button_atlas
 from src.InputSystem import InputAction
+from src.InputSystem.Dispatcher import EventDispatcher
+from src.Libs.Utils.types import vec2
 from src.Libs.Window.display import Display
+from src.Resources import Resource
 from src.Surface import SurfaceRender
+from src.Surface.pool import SurfacePool_
 from src.Window import Window
 
 
 class EmbeddedWindow(Window):
     TITLE = 25
+    BACKGROUND = "White"
+    RETAINED = True
+
     def __init__(self, width=0, height=0, title="Window", icon=None):
         super().__init__(width, height + self.TITLE, title, icon)
+        if isinstance(self.icon, Resource):
+            self.use(self.icon)
         self.icon = SurfaceRender(self.icon) if self.icon else black_surface
+        self.use(close_resources, max_resources, msyh_font)
 
         self.active: bool = False
 
@@ -39,20 +51,46 @@ class EmbeddedWindow(Window):
         self.is_dragging = False
         self.drag_offset = 0
 
+        self.last_box_rect = Rect(0, 0, 0, 0)
+
+        self.dispatcher: EventDispatcher | None = None
+
     def init(self) -> None:
         self.is_dragging = False
         self.drag_offset = 0
 
-    def handle_event(self, event: InputAction):
-        super().handle_event(event)
-        if event.IsBtnDown(Display.get_global_rect(self.title_bar_rect, self.get_center_box())) and not self.max:
+    def bind(self, dispatcher: EventDispatcher) -> None:
+        """
+        向父窗口的事件分发器订阅标题栏拖动和按钮点击，只有自己位于鼠标下方或正在拖动时才会收到鼠标事件
+        """
+        self.dispatcher = dispatcher
+        dispatcher.subscribe(pygame.MOUSEBUTTONDOWN, self.on_mouse_down, 1, self)
+        dispatcher.subscribe(pygame.MOUSEBUTTONUP, self.on_mouse_up, 1, self)
+        dispatcher.subscribe(pygame.MOUSEMOTION, self.on_mouse_motion, owner=self)
+
+    def stop_dragging(self) -> None:
+        self.is_dragging = False
+        if self.dispatcher is not None:
+            self.dispatcher.release(self)
+
+    def on_mouse_down(self, event: InputAction) -> None:
+        center_box = self.get_center_box()
+        if event.IsBtnDown(Display.get_global_rect(self.title_bar_rect, center_box)) and not self.max:
             mouse_pos = event.mousePosition
             self.is_dragging = True
             self.drag_offset = mouse_pos - Display.get_global_size(self.x, self.y, self.parent.box, (self.parent.s_width, self.parent.s_height))
+            self.dispatcher.capture = self
 
-        elif event.IsMouseUp() or self.max:
-            self.is_dragging = False
-        elif event.mouseMotion and self.is_dragging and not self.max:
+        if event.IsBtnDown(Display.get_global_rect(self.close_btn_rect, center_box)):
+            self.close()
+        if event.IsBtnDown(Display.get_global_rect(self.max_btn_rect, center_box)):
+            self.max_window()
+
+    def on_mouse_up(self, event: InputAction) -> None:
+        self.stop_dragging()
+
+    def on_mouse_motion(self, event: InputAction) -> None:
+        if self.is_dragging and not self.max:
             new_pos = event.mousePosition - self.drag_offset
             new_pos = Display.get_global_size(new_pos[0], new_pos[1], self.parent.box, (self.parent.s_width, self.parent.s_height))
             new_pos.x = max(0, int(min(new_pos.x - self.box.get_width() / 2,
@@ -64,17 +102,18 @@ class EmbeddedWindow(Window):
             new_pos = Display.get_return_size(new_pos.x, new_pos.y, self.parent.box, (self.parent.s_width, self.parent.s_height))
             self._x, self._y = new_pos
 
-        if event.IsBtnDown(Display.get_global_rect(self.close_btn_rect, self.get_center_box())):
-            self.close()
-        if event.IsBtnDown(Display.get_global_rect(self.max_btn_rect, self.get_center_box())):
-            self.max_window()
-
     def open(self, x, y) -> None:
         self._x, self._y = x, y
         self.active = True
+        self.parent.invalidate_hits()
+        # 在关闭前的位置重新打开时 track_rect 不会发现变化，需要主动标记
+        self.mark_dirty()
 
     def close(self) -> None:
         self.active = False
+        self.stop_dragging()
+        self.parent.invalidate_hits()
+        self.mark_dirty()
 
     def max_window(self) -> None:
         if self.max:
@@ -83,63 +122,105 @@ class EmbeddedWindow(Window):
             self.w_width, self.w_height = self.parent.s_width, self.parent.s_height
 
         self.max = not self.max
+        self.stop_dragging()
 
     def _draw_text(self) -> None:
         surf = msyh_font.render(self.TITLE + self.TITLE // 4).render(self.title, "Black")
         rec = surf.get_rect(left = Display.get_global_width(self.TITLE // 4 + self.TITLE * 0.8, self.parent.box, (self.parent.s_width, self.parent.s_height)), centery=self.title_bar_rect.centery)
         self.title_bar.blit(surf, rec)
 
-    def _draw_icon(self) -> None:
+    def _draw_icon(self) -> list[tuple]:
         icon_surf = self.icon.render(self.TITLE - self.TITLE // 4, self.TITLE - self.TITLE // 4)
         icon_rect = icon_surf.get_rect(left = Display.get_global_width(self.TITLE // 6, self.parent.box, (self.parent.s_width, self.parent.s_height)), centery=self.title_bar_rect.centery)
-        self.title_bar.blit(icon_surf, icon_rect)
-
-    def _draw_close_btn(self):
-        self.close_btn = Surface(Display.get_global_size(self.TITLE - self.TITLE // 4, self.TITLE - self.TITLE // 4, self.parent.box, (self.parent.s_width, self.parent.s_height)))
+        return [(icon_surf, icon_rect)]
+
+    @staticmethod
+    def _button_glyph(name: str, button_rect: Rect, size: int) -> tuple[Surface, Rect, Rect]:
+        """
+        返回:
+            tuple: 居中画在按钮上的图标 (图集的 subsurface, 位置, 区域)，超出按钮的部分被裁掉
+        """
+        glyph = button_atlas.render(name, size, size)
+        glyph_rect = glyph.get_rect(center=button_rect.center)
+        clipped = glyph_rect.clip(button_rect)
+        return glyph, clipped, Rect(clipped.x - glyph_rect.x, clipped.y - glyph_rect.y, clipped.width, clipped.height)
+
+    def _draw_close_btn(self) -> list[tuple]:
+        self.close_btn = SurfacePool_.resize(self.close_btn, Display.get_global_size(self.TITLE - self.TITLE // 4, self.TITLE - self.TITLE // 4, self.parent.box, (self.parent.s_width, self.parent.s_height)))
         self.close_btn_rect = self.close_btn.get_rect(right=Display.get_global_width(self.w_width - self.TITLE // 6, self.parent.box, (self.parent.s_width, self.parent.s_height)), centery=self.title_bar_rect.centery)
         self.close_btn.fill("Gray")
 
-        close_btn = red_close_surface.render(self.TITLE - self.TITLE // 4 - self.TITLE // 10, self.TITLE - self.TITLE // 4 - self.TITLE // 10)
-        close_btn_rect = close_btn.get_rect(center=Display.center_object(self.close_btn, self.title_bar).center)
-        self.close_btn.blit(close_btn, close_btn_rect)
-        self.title_bar.blit(self.close_btn, self.close_btn_rect)
+        return [(self.close_btn, self.close_btn_rect),
+                self._button_glyph("close", self.close_btn_rect, self.TITLE - self.TITLE // 4 - self.TITLE // 10)]
 
-    def _draw_max_btn(self) -> None:
-        self.max_btn = Surface(Display.get_global_size(self.TITLE - self.TITLE // 4, self.TITLE - self.TITLE // 4, self.parent.box, (self.parent.s_width, self.parent.s_height)))
+    def _draw_max_btn(self) -> list[tuple]:
+        self.max_btn = SurfacePool_.resize(self.max_btn, Display.get_global_size(self.TITLE - self.TITLE // 4, self.TITLE - self.TITLE // 4, self.parent.box, (self.parent.s_width, self.parent.s_height)))
         self.max_btn_rect = self.close_btn.get_rect(
             right=Display.get_global_width(self.w_width - self.TITLE // 6 - self.TITLE // 6, self.parent.box, (self.parent.s_width, self.parent.s_height)) - self.close_btn_rect.width,
             centery=self.title_bar_rect.centery)
         self.max_btn.fill("Gray")
 
-        max_btn = red_max_surface.render(self.TITLE - self.TITLE // 4 - self.TITLE // 10,
-                                             self.TITLE - self.TITLE // 4 - self.TITLE // 10)
-        max_btn_rect = max_btn.get_rect(center=Display.center_object(self.close_btn, self.title_bar).center)
-        self.max_btn.blit(max_btn, max_btn_rect)
-        self.title_bar.blit(self.max_btn, self.max_btn_rect)
+        return [(self.max_btn, self.max_btn_rect),
+                self._button_glyph("max", self.max_btn_rect, self.TITLE - self.TITLE // 4 - self.TITLE // 10)]
 
-    def _draw(self):
-        self.bg = Surface(Display.get_global_size(self.w_width, self.w_height - self.TITLE, self.parent.box, (self.parent.s_width, self.parent.s_height)))
+    def _draw_chrome(self) -> None:
+        self.bg = SurfacePool_.resize(self.bg, Display.get_global_size(self.w_width, self.w_height - self.TITLE, self.parent.box, (self.parent.s_width, self.parent.s_height)))
         self.bg_rect = self.bg.get_rect(top=Display.get_global_height(self.TITLE, self.parent.box, (self.parent.s_width, self.parent.s_height)))
         self.bg.fill("Gray")
 
-        self.title_bar = Surface(Display.get_global_size(self.w_width, self.TITLE, self.parent.box, (self.parent.s_width, self.parent.s_height)))
+        self.title_bar = SurfacePool_.resize(self.title_bar, Display.get_global_size(self.w_width, self.TITLE, self.parent.box, (self.parent.s_width, self.parent.s_height)))
         self.title_bar_rect = self.title_bar.get_rect()
         self.title_bar.fill("Yellow")
 
-        self.box.blit(self.bg, self.bg_rect)
         self._draw_text()
-        self._draw_icon()
-        self._draw_close_btn()
-        self._draw_max_btn()
-        self.box.blit(self.title_bar, self.title_bar_rect)
+        # 图标和按钮用一次 blits 画出，按钮上的图标来自同一张图集
+        self.title_bar.blits(self._draw_icon() + self._draw_close_btn() + self._draw_max_btn(), doreturn=False)
+
+    def layer_key(self) -> tuple:
+        # 标题栏和背景只在缩放后的尺寸变化时重新绘制，后台加载的图标加载完成后也需要重新绘制一次
+        return (self.box.get_size(), self.parent.box.get_size(),
+                self.icon.ready, button_atlas.ready)
+
+    def paint(self, surface: Surface) -> None:
+        self._draw_chrome()
+        surface.blit(self.bg, self.bg_rect)
+        surface.blit(self.title_bar, self.title_bar_rect)
+
+    def get_render_size(self) -> vec2:
+        return Display.get_global_size(self.w_width, self.w_height, self.parent.box, (self.parent.s_width, self.parent.s_height))
+
+    def get_render_rect(self, size: tuple[int, int] | None = None) -> Rect:
+        rect = Rect((0, 0), size if size is not None else self.box.get_size())
+        if not self.max:
+            rect.center = Display.get_global_size(self.w_x, self.w_y, self.parent.box, (self.parent.s_width, self.parent.s_height))
+        return rect
+
+    def predict_rect(self) -> Rect:
+        """
+        返回:
+            Rect: 本帧 render 之后 box_rect 将会是的位置和尺寸
+        """
+        width, height = self.get_render_size()
+        return self.get_render_rect((int(width), int(height)))
+
+    def track_rect(self) -> None:
+        """
+        box_rect 变化后标记新旧两处区域为脏，并让父窗口重建点击测试索引
+        """
+        if self.box_rect != self.last_box_rect:
+            self.parent.mark_dirty(self.last_box_rect)
+            self.mark_dirty()
+            self.last_box_rect = Rect(self.box_rect)
+            self.parent.invalidate_hits()
+
+    def cull(self, rect: Rect) -> None:
+        """
+        本帧完全不可见，跳过绘制，只更新位置
+        """
+        self.box_rect = rect
+        self.track_rect()
 
     def render(self) -> None:
         super().render()
-        self.box = Surface(Display.get_global_size(self.w_width, self.w_height, self.parent.box, (self.parent.s_width, self.parent.s_height)))
-        if not self.max:
-            self.box_rect = self.box.get_rect(center=Display.get_global_size(self.w_x, self.w_y, self.parent.box, (self.parent.s_width, self.parent.s_height)))
-        else:
-            self.box_rect = self.box.get_rect()
-        self.box.fill("White")
-        self._draw()
+        self.track_rect()
         self.parent.box.blit(self.box, self.box_rect)
\ No newline at end of file
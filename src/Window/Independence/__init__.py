@@ -1,15 +1,22 @@
-﻿from pygame import Surface
+﻿import pygame
+from pygame import Surface, Rect
 
 from src.InputSystem import InputAction
+from src.InputSystem.Dispatcher import EventDispatcher
 from src.InputSystem.KeyCode import KeyCode
 from src.Libs.Utils import Message
 from src.Libs.Window.display import Display
+from src.Surface.hit import HitGrid
+from src.Surface.pool import SurfacePool_
+from src.Tracer import Tracer_
 from src.Window import Window
 from src.Window.Embedded import EmbeddedWindow
 
 
 class IndependenceWindow(Window):
     TITLE = 25
+    # 可见面积不超过该比例时才用 set_clip 裁剪；裁剪后的 blit 不一定更快，只遮住一小部分时不值得
+    CLIP_RATIO = 0.5
     def __init__(self, width = 0, height = 0, title = "Window", icon=None, full_key: KeyCode = KeyCode.K_F11) -> None:
         super().__init__(width, height - self.TITLE, title, icon, (width, height))
         self._y = self.TITLE
@@ -20,6 +27,23 @@ class IndependenceWindow(Window):
         self.full_key = full_key
 
         self.embedded_windows: dict[str, EmbeddedWindow] = {}
+        # 重写了 handle_event 的子窗口仍然逐个转发事件，其它子窗口只通过 dispatcher 接收订阅的事件
+        self.legacy_windows: list[EmbeddedWindow] = []
+
+        # 子窗口从下到上的层级，绘制和点击测试都按这个顺序
+        self.z_order: list[EmbeddedWindow] = []
+        self.hits = HitGrid()
+        self.hits_dirty = True
+
+        # 上一帧被剔除、被裁剪和正常绘制的子窗口数量
+        self.culled = 0
+        self.clipped = 0
+        self.drawn = 0
+
+        self.dispatcher = EventDispatcher(self.hit_test)
+        # 分发时先执行指定按钮的处理函数，再执行不限按钮的处理函数，同一组内按订阅顺序
+        # 所以这里订阅左键并且最先订阅，才能在子窗口自己的任何处理函数之前把被点击的窗口置顶
+        self.dispatcher.subscribe(pygame.MOUSEBUTTONDOWN, self._on_mouse_down, 1)
 
         self.topbar = Surface((self.width, self.TITLE))
         self.topbar_rect = self.topbar.get_rect()
@@ -30,6 +54,11 @@ class IndependenceWindow(Window):
             try:
                 _val.parent = self
                 self.embedded_windows[_id] = _val
+                _val.bind(self.dispatcher)
+                self.z_order.append(_val)
+                self.invalidate_hits()
+                if type(_val).handle_event is not EmbeddedWindow.handle_event:
+                    self.legacy_windows.append(_val)
                 for i, w in self.embedded_windows.keys():
                     if not w.parent is self:
                         self.embedded_windows.pop(i)
@@ -40,9 +69,44 @@ class IndependenceWindow(Window):
 
         return Message(False, f"{_id} in")
 
+    def invalidate_hits(self) -> None:
+        """
+        子窗口打开、关闭、移动、缩放或层级变化后调用，下一次点击测试时重建索引
+        """
+        self.hits_dirty = True
+
+    def hit_test(self, pos: tuple[int, int]) -> EmbeddedWindow | None:
+        """
+        参数:
+            pos (tuple): 屏幕坐标
+
+        返回:
+            EmbeddedWindow | None: 位于 pos 处最上层的已打开子窗口
+        """
+        if self.hits_dirty:
+            # 子窗口的 box_rect 是相对于自身 box 的坐标，父窗口整体移动时不需要重建
+            self.hits.rebuild([(w, w.box_rect) for w in self.z_order if w.active])
+            self.hits_dirty = False
+
+        x, y = self.get_center_box().topleft
+        return self.hits.hit((pos[0] - x, pos[1] - y))
+
+    def bring_to_front(self, window: EmbeddedWindow) -> None:
+        if self.z_order and self.z_order[-1] is not window:
+            self.z_order.remove(window)
+            self.z_order.append(window)
+            self.invalidate_hits()
+            window.mark_dirty()
+
+    def _on_mouse_down(self, event: InputAction) -> None:
+        window = self.dispatcher.focus
+        if window is not None and window.active:
+            self.bring_to_front(window)
+
     def handle_event(self, event: InputAction) -> None:
         super().handle_event(event)
-        for i, w in self.embedded_windows.items():
+        self.dispatcher.dispatch(event)
+        for w in self.legacy_windows:
             w.handle_event(event)
 
     def update(self) -> None:
@@ -50,12 +114,76 @@ class IndependenceWindow(Window):
         for i, w in self.embedded_windows.items():
             w.update()
 
-    def beforeRender(self) -> None:
+    def fixed_update(self, dt: float) -> None:
+        super().fixed_update(dt)
         for i, w in self.embedded_windows.items():
+            w.fixed_update(dt)
+
+    @staticmethod
+    def visible_rect(rect: Rect, bounds: Rect, covers: list[Rect]) -> Rect:
+        """
+        计算 rect 在 bounds 内、且没有被 covers 挡住的部分
+
+        只处理能用一个矩形表示的情况：遮挡矩形完全包住时返回空矩形，盖住一整条边时缩小可见区域
+
+        返回:
+            Rect: 可见区域，宽或高为 0 表示完全不可见
+        """
+        visible = rect.clip(bounds)
+        for cover in covers:
+            if not visible.colliderect(cover):
+                continue
+            if cover.contains(visible):
+                return Rect(visible.topleft, (0, 0))
+
+            left, top, right, bottom = visible.left, visible.top, visible.right, visible.bottom
+            if cover.left <= left and cover.right >= right:
+                if cover.top <= top:
+                    top = cover.bottom
+                elif cover.bottom >= bottom:
+                    bottom = cover.top
+            elif cover.top <= top and cover.bottom >= bottom:
+                if cover.left <= left:
+                    left = cover.right
+                elif cover.right >= right:
+                    right = cover.left
+            visible = Rect(left, top, right - left, bottom - top)
+
+        return visible
+
+    def beforeRender(self) -> None:
+        # 从上到下计算每个子窗口的可见区域，子窗口的 box 都不透明，上层的区域会挡住下层
+        bounds = self.box.get_rect()
+        covers = []
+        passes = []
+        for w in reversed(self.z_order):
             if w.active:
+                rect = w.predict_rect()
+                passes.append((w, rect, self.visible_rect(rect, bounds, covers)))
+                covers.append(rect)
+
+        self.culled = self.clipped = self.drawn = 0
+        for w, rect, visible in reversed(passes):
+            if visible.width <= 0 or visible.height <= 0:
+                self.culled += 1
+                w.cull(rect)
+                continue
+
+            clip = visible.width * visible.height <= rect.width * rect.height * self.CLIP_RATIO
+            if clip:
+                self.clipped += 1
+                self.box.set_clip(visible)
+            self.drawn += 1
+
+            with Tracer_.span("afterRender", w):
                 w.afterRender()
+            with Tracer_.span("render", w):
                 w.render()
+            with Tracer_.span("beforeRender", w):
                 w.beforeRender()
+
+            if clip:
+                self.box.set_clip(None)
         super().beforeRender()
 
     def enter(self) -> None:
@@ -83,7 +211,7 @@ class IndependenceWindow(Window):
 
     def render(self) -> None:
         super().render()
-        self.topbar = Surface((self.w_width, Display.get_global_height(self.TITLE, size=(self.s_width, self.s_height))))
+        self.topbar = SurfacePool_.resize(self.topbar, (self.w_width, Display.get_global_height(self.TITLE, size=(self.s_width, self.s_height))))
         self.topbar_rect = self.topbar.get_rect()
         self.topbar.fill("Green")
         self.surface_display.blit(self.topbar, self.topbar_rect)
\ No newline at end of file
@@ -3,9 +3,13 @@ from pygame import Rect
 
 from src.InputSystem import InputAction
 from src.Libs.Utils import Message
+from src.Libs.Window.display import Display
 from src.Libs.Window.resolution import Resolution_
 from src.Manager import Manager
 from src.Surface.Base.DisplaySurface import DisplaySurface
+from src.Surface.compositor import Compositor_
+from src.Surface.dirty import DirtyRegion
+from src.Tracer import Tracer_
 from src.Window import Window
 from src.Window.Independence import IndependenceWindow
 from src.Window.Independence.DefaultWindow import DefaultWindow
@@ -19,6 +23,9 @@ class WindowManager(Manager, DisplaySurface):
         self.current_window = DefaultWindow()
         self.windows: dict[str, IndependenceWindow] = {}
 
+        self.dirty = DirtyRegion()
+        self.alpha = 1.0
+
     def add(self, name: str, value: Window) -> Message[bool]:
         if not name in self.windows.keys():
             try:
@@ -79,12 +86,30 @@ class WindowManager(Manager, DisplaySurface):
     def update(self) -> None:
         self.current_window.update()
 
-    def render(self) -> None:
-        self.current_window.afterRender()
-        self.current_window.render()
-        self.current_window.beforeRender()
+    def fixed_update(self, dt: float) -> None:
+        self.current_window.fixed_update(dt)
+
+    def render(self, alpha: float = 1.0) -> list[Rect]:
+        self.alpha = alpha
+        window = self.current_window
+        with Tracer_.span("afterRender", window):
+            window.afterRender()
+        with Tracer_.span("render", window):
+            window.render()
+        with Tracer_.span("beforeRender", window):
+            window.beforeRender()
+        if Compositor_.debug:
+            for rect in Compositor_.draw_overlay(self.surface_display):
+                self.mark_dirty(rect)
+        return self.dirty.merge(self.get_center_box())
+
+    def mark_dirty(self, rect: Rect | None = None) -> None:
+        self.dirty.add(rect)
 
     def handle_event(self, event: InputAction) -> None:
+        if event.windowExposed:
+            Display.context.update()
+            self.dirty.invalidate()
         self.current_window.handle_event(event)
         if event.IsKeyDown(self.current_window.full_key):
             self.fullscreen()
@@ -100,6 +125,8 @@ class WindowManager(Manager, DisplaySurface):
         pygame.display.set_caption(self.current_window.title)
 
         self.update_surface()
+        Display.context.update()
+        self.dirty.invalidate()
 
     def fullscreen(self) -> None:
         if self.current_window.is_fullscreen:
@@ -1,14 +1,22 @@
-﻿import src.Data
-import src.Editor
-import src.Engine
-import src.InputSystem
-import src.Libs
-import src.Resources
-import src.Surface
-import src.Window
+﻿from src.Lazy import lazy_package
 
-import src.Application
-import src.Color
-import src.ErrorWindow
-import src.Launcher
-import src.Manager
+# 子包和模块在第一次访问时才导入，启动时只加载第一个窗口实际用到的部分
+__getattr__, __dir__ = lazy_package(__name__, (
+    "Data",
+    "Editor",
+    "Engine",
+    "InputSystem",
+    "Libs",
+    "Resources",
+    "Surface",
+    "Window",
+
+    "Application",
+    "Blend",
+    "Color",
+    "ErrorWindow",
+    "Launcher",
+    "Manager",
+    "Startup",
+    "Tracer",
+))
@@ -0,0 +1,27 @@
+﻿import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+import pytest
+
+from src import Blend as blend_module
+from src.Benchmark.blend import parity
+
+
+@pytest.fixture(autouse=True)
+def display() -> None:
+    pygame.display.quit()
+    pygame.init()
+
+
+def test_multiply_matches_per_pixel_reference() -> None:
+    failed = [name for name, ok in parity().items() if not ok]
+    assert not failed, f"Blend.multiply differs from multiply_pixels: {failed}"
+
+
+def test_multiply_without_numpy_matches_per_pixel_reference(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 没有 numpy 时走 fill 的快速路径或逐像素实现，结果也必须一致
+    monkeypatch.setattr(blend_module, "numpy", None)
+    failed = [name for name, ok in parity().items() if not ok]
+    assert not failed, f"Blend.multiply (no numpy) differs from multiply_pixels: {failed}"
\ No newline at end of file
@@ -0,0 +1,76 @@
+﻿import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+import pytest
+
+from src.Benchmark import frame
+from src.Benchmark.frame import BenchApp, BenchWindow, Script
+
+
+def scene_reopen(count: int) -> tuple[BenchApp, Script]:
+    app, _ = frame.scene_embedded(count)
+    window = next(iter(app.windows["main"].embedded_windows.values()))
+
+    def script(app: BenchApp, i: int) -> None:
+        # 在原来的位置关闭再打开
+        if i == 10:
+            window.close()
+        elif i == 20:
+            window.open(window.x, window.y)
+
+    return app, script
+
+
+SCENES = dict(frame.SCENES, reopen=scene_reopen)
+
+
+def stale_frames(name: str, frames: int, count: int = 4) -> list[tuple[int, int]]:
+    """
+    以 dirty_rect 模式运行场景，模拟只接收 pygame.display.update 提交区域的屏幕，
+    每帧与整屏刷新会显示的画面 (display surface) 对比
+
+    返回:
+        list[tuple]: (帧号, 不一致的像素数量)
+    """
+    pygame.display.quit()
+    pygame.init()
+
+    app, script = SCENES[name](count)
+    app.dirty_rect = True
+    screen = {}
+
+    def update(rects=None) -> None:
+        display = pygame.display.get_surface()
+        front = screen.get("front")
+        if front is None or front.get_size() != display.get_size():
+            front = screen["front"] = pygame.Surface(display.get_size())
+        for rect in [display.get_rect()] if rects is None else rects:
+            front.blit(display, rect, rect)
+
+    stale = []
+    original, pygame.display.update = pygame.display.update, update
+    try:
+        app.window_manager.enter()
+        for i in range(frames):
+            frame._frame(app, script, i)
+            expected = pygame.image.tobytes(pygame.display.get_surface(), "RGB")
+            actual = pygame.image.tobytes(screen["front"], "RGB")
+            if actual != expected:
+                stale.append((i, sum(actual[j:j + 3] != expected[j:j + 3] for j in range(0, len(actual), 3))))
+    finally:
+        pygame.display.update = original
+    return stale
+
+
+@pytest.fixture(autouse=True)
+def retained(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 不保留的窗口每帧整个都是脏区，只有保留的窗口才能测出漏交的区域
+    monkeypatch.setattr(BenchWindow, "RETAINED", True)
+
+
+@pytest.mark.parametrize("name, frames", [("embedded", 10), ("drag", 150), ("switch", 40), ("reopen", 40)])
+def test_dirty_rect_matches_full_redraw(name: str, frames: int) -> None:
+    stale = stale_frames(name, frames)
+    assert not stale, f"{name}: (frame, wrong pixels) {stale[:10]}"
\ No newline at end of file